@@ -0,0 +1 @@
+# AlphaHuman dev tooling — host-side runtime, types, and build helpers for skills-py
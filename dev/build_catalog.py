@@ -0,0 +1,379 @@
+"""
+Build skills-catalog.json — an index of every skill under skills-py/.
+
+For python skills the catalog entry is extracted from the SkillDefinition
+exported by skill.py; typescript skills fall back to package.json metadata.
+
+Run from the repo root:
+    python -m dev.build_catalog
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+import json
+import os
+import sys
+import types
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills-py"
+
+
+def _has_ts_file(dir_path: str) -> bool:
+  """Return True if any .ts file exists under dir_path.
+
+  Iterative os.scandir DFS with early exit: DirEntry carries the d_type
+  bits from readdir, so the common case costs one directory read and no
+  per-entry stat calls.
+  """
+  stack = [dir_path]
+  while stack:
+    top = stack.pop()
+    try:
+      with os.scandir(top) as it:
+        for entry in it:
+          if entry.name.endswith(".ts") and entry.is_file(follow_symlinks=False):
+            return True
+          if entry.is_dir(follow_symlinks=False):
+            stack.append(entry.path)
+    except OSError:
+      continue
+  return False
+
+
+def _scan_markers(dir_path: Path) -> tuple[bool, bool, bool]:
+  """One scandir pass recording skill.py / package.json / src/ presence."""
+  has_skill_py = False
+  has_pkg_json = False
+  has_src_dir = False
+  with os.scandir(dir_path) as it:
+    for entry in it:
+      if entry.name == "skill.py":
+        has_skill_py = True
+      elif entry.name == "package.json":
+        has_pkg_json = True
+      elif entry.name == "src" and entry.is_dir(follow_symlinks=False):
+        has_src_dir = True
+  return has_skill_py, has_pkg_json, has_src_dir
+
+
+def detect_execution_style(
+  dir_path: Path, markers: tuple[bool, bool, bool] | None = None
+) -> str:
+  """Classify a skill directory as python, typescript, or unknown.
+
+  Checks are ordered cheapest-first so the recursive .ts walk only runs
+  for directories the single scandir pass could not classify. Callers
+  that already scanned the directory pass their markers to avoid a
+  second pass.
+  """
+  has_skill_py, has_pkg_json, has_src_dir = markers or _scan_markers(dir_path)
+
+  if has_skill_py:
+    return "python"
+  if has_pkg_json and has_src_dir:
+    return "typescript"
+  if _has_ts_file(str(dir_path)):
+    return "typescript"
+  return "unknown"
+
+
+def _literal(node: ast.expr) -> Any:
+  """ast.literal_eval that returns None instead of raising."""
+  try:
+    return ast.literal_eval(node)
+  except (ValueError, SyntaxError):
+    return None
+
+
+def _extract_via_ast(skill_py_path: Path) -> dict[str, Any] | None:
+  """Statically extract catalog metadata from the `skill = SkillDefinition(...)`
+  assignment without importing the module.
+
+  Returns None when the file does not match the expected shape (e.g. the
+  definition is built from computed expressions), in which case the caller
+  falls back to a full import.
+  """
+  try:
+    tree = ast.parse(skill_py_path.read_bytes(), filename=str(skill_py_path))
+  except (OSError, SyntaxError):
+    return None
+
+  call: ast.Call | None = None
+  for node in tree.body:
+    if (
+      isinstance(node, ast.Assign)
+      and len(node.targets) == 1
+      and isinstance(node.targets[0], ast.Name)
+      and node.targets[0].id == "skill"
+      and isinstance(node.value, ast.Call)
+      and isinstance(node.value.func, ast.Name)
+      and node.value.func.id == "SkillDefinition"
+    ):
+      call = node.value
+  if call is None:
+    return None
+
+  meta: dict[str, Any] = {
+    "name": None,
+    "description": "",
+    "version": "",
+    "tools": [],
+    "hooks": [],
+    "tick_interval": None,
+  }
+  for kw in call.keywords:
+    if kw.arg in ("name", "description", "version", "tick_interval"):
+      meta[kw.arg] = _literal(kw.value)
+    elif kw.arg == "tools" and isinstance(kw.value, ast.List):
+      # tools=[SkillTool(definition=ToolDefinition(name=..., ...), ...), ...]
+      names: list[str] = []
+      for elt in kw.value.elts:
+        if not isinstance(elt, ast.Call):
+          return None
+        for tool_kw in elt.keywords:
+          if tool_kw.arg == "definition" and isinstance(tool_kw.value, ast.Call):
+            for def_kw in tool_kw.value.keywords:
+              if def_kw.arg == "name":
+                names.append(_literal(def_kw.value))
+      if any(not isinstance(n, str) for n in names):
+        return None
+      meta["tools"] = names
+    elif kw.arg == "tools":
+      # Computed expression (e.g. _build_tools()) — cannot resolve statically.
+      return None
+    elif kw.arg == "hooks" and isinstance(kw.value, ast.Call):
+      meta["hooks"] = [
+        hook_kw.arg
+        for hook_kw in kw.value.keywords
+        if hook_kw.arg is not None
+        and not (isinstance(hook_kw.value, ast.Constant) and hook_kw.value.value is None)
+      ]
+
+  if not isinstance(meta["name"], str):
+    return None
+  return meta
+
+
+def extract_skill_py(
+  skill_py_path: Path,
+  warnings: list[str] | None = None,
+  has_skill_py: bool | None = None,
+) -> dict[str, Any] | None:
+  """Extract catalog metadata from a skill.py SkillDefinition.
+
+  Tries a static AST walk first (no import cost); falls back to importing
+  the module only when the definition uses computed expressions. Pass
+  has_skill_py when the caller already scanned the directory to skip the
+  exists() stat.
+  """
+  if not (skill_py_path.exists() if has_skill_py is None else has_skill_py):
+    return None
+
+  meta = _extract_via_ast(skill_py_path)
+  if meta is not None:
+    return meta
+
+  # Deferred: pydantic model import builds validators eagerly, and the AST
+  # fast path above makes it unnecessary for most skills.
+  from dev.types.skill_types import SkillDefinition
+
+  # Each skill imports under its own name inside a synthetic parent package,
+  # so concurrent extractions cannot shadow each other's modules and
+  # intra-skill relative imports resolve without mutating sys.path.
+  pkg = sys.modules.get("_skill_catalog")
+  if pkg is None:
+    pkg = types.ModuleType("_skill_catalog")
+    pkg.__path__ = [str(skill_py_path.parent.parent)]
+    sys.modules["_skill_catalog"] = pkg
+
+  dir_name = skill_py_path.parent.name
+  mod_name = f"_skill_catalog.{dir_name}"
+  spec = importlib.util.spec_from_file_location(
+    mod_name, skill_py_path, submodule_search_locations=[str(skill_py_path.parent)]
+  )
+  if spec is None or spec.loader is None:
+    return None
+  module = importlib.util.module_from_spec(spec)
+  module.__package__ = mod_name
+  sys.modules[mod_name] = module
+  try:
+    spec.loader.exec_module(module)
+  except Exception as e:
+    sys.modules.pop(mod_name, None)
+    msg = f"warning: could not import {skill_py_path}: {e}"
+    if warnings is not None:
+      warnings.append(msg)
+    else:
+      print(f"  {msg}", file=sys.stderr)
+    return None
+
+  skill = getattr(module, "skill", None)
+  sys.modules.pop(mod_name, None)
+  if not isinstance(skill, SkillDefinition):
+    return None
+
+  hooks: list[str] = []
+  if skill.hooks:
+    hooks = [name for name, fn in skill.hooks if fn is not None]
+
+  return {
+    "name": skill.name,
+    "description": skill.description,
+    "version": skill.version,
+    "tools": [t.definition.name for t in skill.tools],
+    "hooks": hooks,
+    "tick_interval": skill.tick_interval,
+  }
+
+
+def read_pkg_json(pkg_json_path: Path) -> dict[str, Any] | None:
+  """Read catalog metadata from a typescript skill's package.json."""
+  try:
+    data = json.loads(pkg_json_path.read_text(encoding="utf-8"))
+  except (OSError, json.JSONDecodeError):
+    return None
+  return {
+    "name": data.get("name", ""),
+    "description": data.get("description", ""),
+    "version": data.get("version", ""),
+  }
+
+
+def _fingerprint(dir_path: Path) -> list[Any]:
+  """Cheap change fingerprint for a skill directory.
+
+  (mtime_ns, size) of skill.py and package.json, the directory's own
+  mtime (catches top-level adds/removes, including the src/ marker), and
+  the recursive .ts probe result. The probe is what execution_style is
+  actually derived from: adding or removing a .ts file inside a
+  subdirectory leaves the top-level mtime untouched, so the boolean has
+  to be part of the key. Stored on catalog entries so unchanged skills
+  skip the expensive re-import on the next build.
+  """
+  fp: list[Any] = []
+  for target in (dir_path, dir_path / "skill.py", dir_path / "package.json"):
+    try:
+      st = os.stat(target)
+      fp.append([st.st_mtime_ns, st.st_size])
+    except FileNotFoundError:
+      fp.append(None)
+  fp.append(_has_ts_file(str(dir_path)))
+  return fp
+
+
+def _load_prev_catalog(output_path: Path) -> dict[str, dict[str, Any]]:
+  """Load the previous catalog keyed by entry path, or {} if unusable."""
+  try:
+    prev_catalog = json.loads(output_path.read_text(encoding="utf-8"))
+    return {entry["path"]: entry for entry in prev_catalog["skills"]}
+  except (OSError, json.JSONDecodeError, KeyError, TypeError):
+    return {}
+
+
+def _process_skill(dir_name: str, skills_dir_str: str) -> tuple[dict[str, Any], list[str]]:
+  """Build the catalog entry for one skill directory.
+
+  Pure function of its arguments so it can run in a ProcessPoolExecutor
+  worker; warnings are returned rather than printed to keep output ordered.
+  """
+  dir_path = Path(skills_dir_str) / dir_name
+  warnings: list[str] = []
+
+  markers = _scan_markers(dir_path)
+  style = detect_execution_style(dir_path, markers)
+  entry: dict[str, Any] = {"id": dir_name, "path": dir_name, "execution_style": style}
+
+  meta = extract_skill_py(dir_path / "skill.py", warnings, has_skill_py=markers[0])
+  if meta is None:
+    meta = read_pkg_json(dir_path / "package.json")
+  if meta:
+    entry.update(meta)
+  entry["_fp"] = _fingerprint(dir_path)
+
+  return entry, warnings
+
+
+def main() -> None:
+  with os.scandir(SKILLS_DIR) as it:
+    entries = sorted(
+      e.name for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")
+    )
+
+  output_path = SKILLS_DIR / "skills-catalog.json"
+  prev = _load_prev_catalog(output_path)
+
+  # Partition into cached entries (cheap stat check) and skills that need a
+  # full rebuild; only the latter are farmed out to worker processes, since
+  # exec_module is the dominant cost and is embarrassingly parallel.
+  cached_entries: dict[str, dict[str, Any]] = {}
+  to_build: list[str] = []
+  for dir_name in entries:
+    fp = _fingerprint(SKILLS_DIR / dir_name)
+    cached = prev.get(dir_name)
+    if cached is not None and cached.get("_fp") == fp:
+      cached_entries[dir_name] = cached
+    else:
+      to_build.append(dir_name)
+
+  built: dict[str, tuple[dict[str, Any], list[str]]] = {}
+  if to_build:
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+      results = ex.map(
+        partial(_process_skill, skills_dir_str=str(SKILLS_DIR)), to_build, chunksize=4
+      )
+      built = dict(zip(to_build, results))
+
+  catalog_skills: list[dict[str, Any]] = []
+
+  for dir_name in entries:
+    cached = cached_entries.get(dir_name)
+    if cached is not None:
+      entry = cached
+      print(f"  {dir_name}: cached")
+    else:
+      entry, warnings = built[dir_name]
+      for msg in warnings:
+        print(f"  {msg}", file=sys.stderr)
+      print(
+        f"  {dir_name}: {entry['execution_style']} ({len(entry.get('tools', []))} tools)"
+      )
+
+    catalog_skills.append(entry)
+
+  # Duplicate detection runs once over the gathered entries, keeping the
+  # per-skill work (and the pool workers) free of shared state.
+  names = [e.get("name") or e["id"] for e in catalog_skills]
+  dupes = {n for n, c in Counter(names).items() if c > 1}
+  for name in sorted(dupes):
+    paths = [e["path"] for e, n in zip(catalog_skills, names) if n == name]
+    print(
+      f"  warning: duplicate skill name {name!r} at {', '.join(paths)}", file=sys.stderr
+    )
+
+  catalog = {"version": 1, "skills": catalog_skills}
+  # orjson has no streaming encoder: it materialises the catalog as one
+  # bytes object in C (still faster and cheaper than dumps + encode) and
+  # writes it in a single call. Only the stdlib fallback streams chunks
+  # to the file handle via json.dump.
+  try:
+    import orjson
+
+    with open(output_path, "wb") as f:
+      f.write(orjson.dumps(catalog, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+  except ImportError:
+    with open(output_path, "w", encoding="utf-8") as f:
+      json.dump(catalog, f, indent=2)
+      f.write("\n")
+  print(f"Wrote {output_path} ({len(catalog_skills)} skills)")
+
+
+if __name__ == "__main__":
+  main()
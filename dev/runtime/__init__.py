@@ -0,0 +1 @@
+# Host-side runtime for Python skills (SkillServer JSON-RPC protocol)
@@ -0,0 +1,536 @@
+"""
+SkillServer — JSON-RPC 2.0 over stdio for Python skills.
+
+The host spawns `python -m skills.<name>` and speaks newline-delimited
+JSON-RPC on stdin/stdout. Inbound requests drive the skill lifecycle and
+tool calls; the server issues reverse RPCs back to the host over the same
+pipe for memory, session, entity, state, and data access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+  from dev.types.skill_types import SkillDefinition
+
+log = logging.getLogger("skill.runtime.server")
+
+# Shared result for acknowledge-only methods; never mutated.
+_OK = {"ok": True}
+
+# orjson encodes straight to bytes in C (one pass over the payload instead of
+# dumps + encode); fall back to stdlib json when it is not installed.
+try:
+  import orjson
+
+  _dumps_raw = orjson.dumps
+  _loads = orjson.loads
+except ImportError:
+  _COMPACT = (",", ":")
+
+  def _dumps_raw(obj: Any) -> bytes:
+    return json.dumps(obj, separators=_COMPACT).encode()
+
+  _loads = json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+  return _dumps_raw(obj) + b"\n"
+
+
+# Response envelopes are framed from pre-encoded byte parts instead of
+# allocating a {"jsonrpc": ..., "id": ..., "result": ...} dict per message.
+_RESP_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESP_RESULT = b',"result":'
+_RESP_ERROR = b',"error":'
+_RESP_END = b"}\n"
+
+
+def _build_arg_validators(tools: Any) -> dict[str, Callable[[dict[str, Any]], Any]]:
+  """Compile one argument validator per tool from its parameters schema.
+
+  fastjsonschema compiles each schema to a plain function once, so a
+  tool call validates with a single call instead of re-walking the
+  schema. Tools that share an identical schema share one compiled
+  function; without fastjsonschema the table is empty and arguments
+  pass through unchecked, as before.
+  """
+  try:
+    import fastjsonschema
+  except ImportError:
+    return {}
+  validators: dict[str, Callable[[dict[str, Any]], Any]] = {}
+  compiled: dict[str, Callable[[dict[str, Any]], Any]] = {}
+  for tool in tools:
+    schema = tool.definition.parameters
+    if not schema:
+      continue
+    key = json.dumps(schema, sort_keys=True)
+    fn = compiled.get(key)
+    if fn is None:
+      fn = compiled[key] = fastjsonschema.compile(schema)
+    validators[tool.definition.name] = fn
+  return validators
+
+
+class _Memory:
+  def __init__(self, server: SkillServer) -> None:
+    self._server = server
+
+  async def read(self, key: str) -> Any:
+    return await self._server._reverse_rpc("memory/read", {"key": key})
+
+  async def write(self, key: str, value: Any) -> None:
+    await self._server._reverse_rpc("memory/write", {"key": key, "value": value})
+
+
+class _Session:
+  def __init__(self, server: SkillServer) -> None:
+    self._server = server
+
+  @property
+  def id(self) -> str:
+    return self._server._session_id
+
+  async def get(self, key: str) -> Any:
+    return await self._server._reverse_rpc("session/get", {"key": key})
+
+  async def set(self, key: str, value: Any) -> None:
+    await self._server._reverse_rpc("session/set", {"key": key, "value": value})
+
+
+class _Entities:
+  def __init__(self, server: SkillServer) -> None:
+    self._server = server
+
+  async def upsert(self, entity: dict[str, Any]) -> Any:
+    return await self._server._reverse_rpc("entities/upsert", {"entity": entity})
+
+  async def upsert_relationship(self, relationship: dict[str, Any]) -> Any:
+    return await self._server._reverse_rpc(
+      "entities/upsertRelationship", {"relationship": relationship}
+    )
+
+
+class _Tools:
+  def __init__(self, server: SkillServer) -> None:
+    self._server = server
+
+  async def call(self, skill_name: str, tool: str, args: dict[str, Any]) -> Any:
+    return await self._server._reverse_rpc(
+      "skills/callTool", {"skill": skill_name, "tool": tool, "args": args}
+    )
+
+
+class _Context:
+  """SkillContext implementation backed by reverse RPCs to the host.
+
+  One instance is built per server in __init__; data_dir and session id
+  read through to the server so late-bound values stay visible.
+  """
+
+  def __init__(self, server: SkillServer) -> None:
+    self._server = server
+    self.memory = _Memory(server)
+    self.session = _Session(server)
+    self.entities = _Entities(server)
+    self.tools = _Tools(server)
+
+  @property
+  def data_dir(self) -> str:
+    return self._server._data_dir
+
+  def log(self, message: str) -> None:
+    server = self._server
+    server._loop.create_task(server._reverse_rpc("host/log", {"message": message}))
+
+  def get_state(self) -> dict[str, Any]:
+    return dict(self._server._state)
+
+  def set_state(self, partial: dict[str, Any]) -> None:
+    server = self._server
+    server._state.update(partial)
+    server._loop.create_task(server._reverse_rpc("state/set", {"state": partial}))
+
+  def emit_event(self, name: str, payload: dict[str, Any] | None = None) -> None:
+    server = self._server
+    server._loop.create_task(
+      server._reverse_rpc("host/event", {"name": name, "payload": payload or {}})
+    )
+
+  async def read_data(self, filename: str) -> str | None:
+    return await self._server._reverse_rpc("data/read", {"filename": filename})
+
+  async def write_data(self, filename: str, content: str) -> None:
+    await self._server._reverse_rpc(
+      "data/write", {"filename": filename, "content": content}
+    )
+
+
+class SkillServer:
+  """Serves one SkillDefinition over stdio JSON-RPC."""
+
+  def __init__(self, skill: SkillDefinition, data_dir: str | None = None) -> None:
+    self._skill = skill
+    self._data_dir = data_dir or "."
+    self._manifest: dict[str, Any] = {}
+    self._state: dict[str, Any] = {}
+    self._session_id: str = ""
+    # Responses bypass the asyncio transport machinery: sub-KB frames are
+    # written straight to the stdout fd, serialised by a lock since
+    # os.write is only atomic below PIPE_BUF.
+    self._stdout_fd = sys.stdout.fileno()
+    self._write_lock = threading.Lock()
+    # Reverse-RPC futures live in an index-addressed slot list (IDs are
+    # server-generated monotonic ints); reclaimed slots are reused via a
+    # free list so long-running skills don't grow the table unbounded.
+    self._pending: list[asyncio.Future[Any] | None] = []
+    self._free_ids: list[int] = []
+    self._running = False
+    self._loop: asyncio.AbstractEventLoop | None = None
+    self._reader: asyncio.StreamReader | None = None
+    self._tasks: set[asyncio.Task[Any]] = set()
+
+    # Tool definitions are immutable after construction, so the tools/list
+    # result can be built once instead of on every host poll.
+    self._tools_list_response = {
+      "tools": [
+        {
+          "name": t.definition.name,
+          "description": t.definition.description,
+          "inputSchema": {
+            "type": "object",
+            "properties": t.definition.parameters.get("properties", {}),
+            "required": t.definition.parameters.get("required"),
+          },
+        }
+        for t in skill.tools
+      ]
+    }
+    # ... and pre-encoded once to bytes: tools/list is polled by the
+    # host, and _write_response splices raw bytes straight into the
+    # response frame, so serving it costs no serialization at all.
+    self._tools_list_bytes = _dumps_raw(self._tools_list_response)
+
+    # Name -> tool index for tools/call: one hash probe instead of a
+    # linear scan over the definitions per invocation.
+    self._tools_by_name = {t.definition.name: t for t in skill.tools}
+
+    # Per-tool compiled argument validators, shared across identical
+    # schemas; empty when fastjsonschema is not installed.
+    self._arg_validators = _build_arg_validators(skill.tools)
+
+    # Method dispatch: an interned-key str -> int map plus a handler tuple.
+    # The method set is fixed at startup, so one dict lookup yields an index
+    # into the tuple — bound methods are resolved once here rather than
+    # re-bound per message.
+    self._handlers: tuple[Callable[[dict[str, Any]], Awaitable[Any]], ...] = (
+      self._h_tools_list,
+      self._h_tools_call,
+      self._h_load,
+      self._h_unload,
+      self._h_session_start,
+      self._h_session_end,
+      self._h_before_message,
+      self._h_after_response,
+      self._h_tick,
+      self._h_status,
+      self._h_memory_flush,
+      self._h_setup_start,
+      self._h_setup_submit,
+      self._h_setup_cancel,
+      self._h_disconnect,
+      self._h_noop,  # skill/activate
+      self._h_noop,  # skill/deactivate
+    )
+    self._methods: dict[str, int] = {
+      sys.intern(name): i
+      for i, name in enumerate(
+        (
+          "tools/list",
+          "tools/call",
+          "skill/load",
+          "skill/unload",
+          "skill/sessionStart",
+          "skill/sessionEnd",
+          "skill/beforeMessage",
+          "skill/afterResponse",
+          "skill/tick",
+          "skill/status",
+          "skill/memoryFlush",
+          "skill/setupStart",
+          "skill/setupSubmit",
+          "skill/setupCancel",
+          "skill/disconnect",
+          "skill/activate",
+          "skill/deactivate",
+        )
+      )
+    }
+
+    # One context for the life of the server; building it per hook call
+    # re-created and re-instantiated every helper class each time.
+    self._context = _Context(self)
+
+  def start(self) -> None:
+    """Run the server until the host closes stdin or sends skill/shutdown."""
+    asyncio.run(self._run())
+
+  # -------------------------------------------------------------------------
+  # I/O loop
+  # -------------------------------------------------------------------------
+
+  async def _run(self) -> None:
+    # Cached once: get_event_loop() walks thread-local state on every call
+    # and is deprecated outside a running loop.
+    loop = self._loop = asyncio.get_running_loop()
+
+    reader = self._reader = asyncio.StreamReader()
+    protocol = asyncio.StreamReaderProtocol(reader)
+    await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+
+    self._running = True
+
+    # Drain whatever bytes the OS already buffered and split frames locally:
+    # one wakeup can dispatch many messages, and independently-IDed requests
+    # run concurrently instead of serialising behind each other's awaits.
+    in_buf = bytearray()
+    while self._running:
+      chunk = await reader.read(65536)
+      if not chunk:
+        break
+      in_buf += chunk
+      nl = in_buf.find(b"\n")
+      while nl != -1:
+        line = bytes(in_buf[:nl])
+        del in_buf[: nl + 1]
+        nl = in_buf.find(b"\n")
+        if not line.strip():
+          continue
+        try:
+          message = _loads(line)
+        except ValueError:
+          log.warning("Dropping malformed JSON-RPC frame: %r", line[:200])
+          continue
+        task = asyncio.create_task(self._handle_message(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    if self._tasks:
+      await asyncio.gather(*self._tasks, return_exceptions=True)
+
+  async def _handle_message(self, message: dict[str, Any]) -> None:
+    msg_id = message.get("id")
+    method = message.get("method")
+
+    if method is None:
+      # Response to one of our reverse RPCs.
+      future = None
+      if isinstance(msg_id, int) and 0 <= msg_id < len(self._pending):
+        future = self._pending[msg_id]
+        self._pending[msg_id] = None
+        self._free_ids.append(msg_id)
+      if future is not None and not future.done():
+        if "error" in message:
+          future.set_exception(RuntimeError(str(message["error"])))
+        else:
+          future.set_result(message.get("result"))
+      return
+
+    if method == "skill/shutdown":
+      await self._write_response(msg_id, _OK)
+      self._loop.call_later(0.1, self._stop)
+      return
+
+    try:
+      result = await self._dispatch(method, message.get("params") or {})
+    except Exception as e:
+      log.exception("Error handling %s", method)
+      if msg_id is not None:
+        await self._write_response(msg_id, error={"code": -32000, "message": str(e)})
+      return
+
+    if msg_id is not None:
+      await self._write_response(msg_id, result)
+
+  async def _write_message(self, message: dict[str, Any]) -> None:
+    await self._write_raw(_dumps(message))
+
+  async def _write_response(
+    self, msg_id: Any, result: Any = None, error: dict[str, Any] | None = None
+  ) -> None:
+    if error is not None:
+      tail = _RESP_ERROR + _dumps_raw(error)
+    elif type(result) is bytes:
+      # Pre-encoded JSON from a handler; splice it in verbatim.
+      tail = _RESP_RESULT + result
+    else:
+      tail = _RESP_RESULT + _dumps_raw(result)
+    await self._write_raw(_RESP_PREFIX + _dumps_raw(msg_id) + tail + _RESP_END)
+
+  async def _write_raw(self, data: bytes) -> None:
+    mv = memoryview(data)
+    pos = 0
+    with self._write_lock:
+      while pos < len(mv):
+        pos += os.write(self._stdout_fd, mv[pos:])
+
+  def _stop(self) -> None:
+    self._running = False
+    # The read loop is parked in reader.read(); flipping _running alone
+    # leaves it blocked until the host closes stdin. feed_eof() makes the
+    # pending read return b"" so the loop exits and the process can quit.
+    if self._reader is not None:
+      self._reader.feed_eof()
+    for future in self._pending:
+      if future is not None and not future.done():
+        future.cancel()
+    self._pending.clear()
+    self._free_ids.clear()
+
+  # -------------------------------------------------------------------------
+  # Dispatch
+  # -------------------------------------------------------------------------
+
+  async def _dispatch(self, method: str, p: dict[str, Any]) -> Any:
+    idx = self._methods.get(method)
+    if idx is None:
+      raise ValueError(f"Unknown method: {method}")
+    return await self._handlers[idx](p)
+
+  async def _h_tools_list(self, p: dict[str, Any]) -> Any:
+    return self._tools_list_bytes
+
+  async def _h_tools_call(self, p: dict[str, Any]) -> Any:
+    name = p.get("name")
+    args = p.get("arguments") or {}
+    tool = self._tools_by_name.get(name)
+    if tool is None:
+      raise ValueError(f"Unknown tool: {name}")
+    validate = self._arg_validators.get(name)
+    if validate is not None:
+      try:
+        args = validate(args)
+      except Exception as e:
+        raise ValueError(f"Invalid arguments for {name}: {e}") from e
+    result = await tool.execute(args)
+    return {"content": result.content, "isError": result.is_error}
+
+  async def _h_load(self, p: dict[str, Any]) -> Any:
+    self._manifest = p.get("manifest") or {}
+    self._data_dir = p.get("dataDir") or self._data_dir
+    hooks = self._skill.hooks
+    if hooks and hooks.on_load:
+      await hooks.on_load(self._context)
+    return _OK
+
+  async def _h_unload(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_unload:
+      await hooks.on_unload(self._context)
+    return _OK
+
+  async def _h_session_start(self, p: dict[str, Any]) -> Any:
+    self._session_id = p.get("sessionId", "")
+    hooks = self._skill.hooks
+    if hooks and hooks.on_session_start:
+      await hooks.on_session_start(self._context, self._session_id)
+    return _OK
+
+  async def _h_session_end(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_session_end:
+      await hooks.on_session_end(self._context, p.get("sessionId", ""))
+    return _OK
+
+  async def _h_before_message(self, p: dict[str, Any]) -> Any:
+    replaced = None
+    hooks = self._skill.hooks
+    if hooks and hooks.on_before_message:
+      replaced = await hooks.on_before_message(self._context, p.get("message", ""))
+    return {"message": replaced}
+
+  async def _h_after_response(self, p: dict[str, Any]) -> Any:
+    replaced = None
+    hooks = self._skill.hooks
+    if hooks and hooks.on_after_response:
+      replaced = await hooks.on_after_response(self._context, p.get("response", ""))
+    return {"response": replaced}
+
+  async def _h_tick(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_tick:
+      await hooks.on_tick(self._context)
+    return _OK
+
+  async def _h_status(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_status:
+      return await hooks.on_status(self._context)
+    return {}
+
+  async def _h_memory_flush(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_memory_flush:
+      await hooks.on_memory_flush(self._context)
+    return _OK
+
+  async def _h_setup_start(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_setup_start:
+      step = await hooks.on_setup_start(self._context)
+      return step.model_dump()
+    raise ValueError("Skill does not implement setup")
+
+  async def _h_setup_submit(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_setup_submit:
+      result = await hooks.on_setup_submit(
+        self._context, p.get("stepId", ""), p.get("values") or {}
+      )
+      return result.model_dump()
+    raise ValueError("Skill does not implement setup")
+
+  async def _h_setup_cancel(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_setup_cancel:
+      await hooks.on_setup_cancel(self._context)
+    return _OK
+
+  async def _h_disconnect(self, p: dict[str, Any]) -> Any:
+    hooks = self._skill.hooks
+    if hooks and hooks.on_disconnect:
+      await hooks.on_disconnect(self._context)
+    return _OK
+
+  async def _h_noop(self, p: dict[str, Any]) -> Any:
+    return _OK
+
+  # -------------------------------------------------------------------------
+  # Reverse RPC + context
+  # -------------------------------------------------------------------------
+
+  async def _reverse_rpc(self, method: str, params: dict[str, Any]) -> Any:
+    future: asyncio.Future[Any] = self._loop.create_future()
+    if self._free_ids:
+      msg_id = self._free_ids.pop()
+      self._pending[msg_id] = future
+    else:
+      msg_id = len(self._pending)
+      self._pending.append(future)
+    await self._write_message(
+      {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params}
+    )
+    return await future
+
+
+def run_skill_server(skill: SkillDefinition) -> None:
+  """Convenience wrapper: build a SkillServer and block until shutdown."""
+  SkillServer(skill).start()
@@ -0,0 +1 @@
+# Security scanning helpers for skill source
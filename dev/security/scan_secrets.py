@@ -0,0 +1,88 @@
+"""
+Secret scanning for skill source files.
+
+scan_content() runs a fixed set of regex patterns over file content and
+returns findings; "error" severity findings should block a skill from
+being published.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+
+@dataclass
+class SecretFinding:
+  """One suspected secret in a scanned file."""
+
+  file: str
+  line: int
+  severity: str  # "error" | "warning"
+  pattern: str
+  description: str
+
+
+# (name, compiled regex, severity, description)
+_PATTERNS: list[tuple[str, re.Pattern[str], str, str]] = [
+  (
+    "aws-access-key",
+    re.compile(r"AKIA[0-9A-Z]{16}"),
+    "error",
+    "AWS access key ID",
+  ),
+  (
+    "github-token",
+    re.compile(r"gh[pousr]_[A-Za-z0-9]{36,}"),
+    "error",
+    "GitHub token",
+  ),
+  (
+    "openai-key",
+    re.compile(r"sk-[A-Za-z0-9]{20}T3BlbkFJ[A-Za-z0-9]{20}"),
+    "error",
+    "OpenAI API key",
+  ),
+  (
+    "private-key-block",
+    re.compile(r"-----BEGIN (?:RSA |EC |OPENSSH )?PRIVATE KEY-----"),
+    "error",
+    "Private key material",
+  ),
+  (
+    "slack-token",
+    re.compile(r"xox[baprs]-[A-Za-z0-9-]{10,}"),
+    "error",
+    "Slack token",
+  ),
+  (
+    "hardcoded-password",
+    re.compile(r"""(?i)(?:password|passwd|secret)\s*=\s*["'][^"']{8,}["']"""),
+    "warning",
+    "Possible hardcoded credential",
+  ),
+  (
+    "generic-api-key",
+    re.compile(r"""(?i)api[_-]?key\s*=\s*["'][A-Za-z0-9_\-]{20,}["']"""),
+    "warning",
+    "Possible hardcoded API key",
+  ),
+]
+
+
+def scan_content(content: str, path: str) -> list[SecretFinding]:
+  """Scan file content and return all findings, tagged with `path`."""
+  findings: list[SecretFinding] = []
+  for lineno, line in enumerate(content.splitlines(), start=1):
+    for name, pattern, severity, description in _PATTERNS:
+      if pattern.search(line):
+        findings.append(
+          SecretFinding(
+            file=path,
+            line=lineno,
+            severity=severity,
+            pattern=name,
+            description=description,
+          )
+        )
+  return findings
@@ -0,0 +1 @@
+# Shared type definitions for Python skills and the host runtime
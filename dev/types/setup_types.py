@@ -0,0 +1,64 @@
+"""
+Setup-wizard type definitions.
+
+Skills with `has_setup=True` implement on_setup_start / on_setup_submit /
+on_setup_cancel hooks that exchange these types with the host UI.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SetupFieldOption(BaseModel):
+  """One selectable option for a select/multiselect field."""
+
+  label: str
+  value: str
+
+
+class SetupField(BaseModel):
+  """A single input field on a setup step.
+
+  Field types: text, password, number, select, multiselect, boolean.
+  """
+
+  name: str
+  type: str
+  label: str
+  description: str = ""
+  required: bool = False
+  placeholder: str | None = None
+  options: list[SetupFieldOption] | None = None
+  default: Any = None
+
+
+class SetupStep(BaseModel):
+  """One step of the setup wizard."""
+
+  id: str
+  title: str
+  description: str = ""
+  fields: list[SetupField] = Field(default_factory=list)
+
+
+class SetupFieldError(BaseModel):
+  """Validation error attached to a field (empty field = step-level error)."""
+
+  field: str
+  message: str
+
+
+class SetupResult(BaseModel):
+  """Outcome of a setup step submit.
+
+  status: "complete" (setup done), "next" (advance to next_step), or
+  "error" (show errors, stay on current step).
+  """
+
+  status: str
+  errors: list[SetupFieldError] = Field(default_factory=list)
+  next_step: SetupStep | None = None
+  message: str | None = None
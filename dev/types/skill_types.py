@@ -0,0 +1,177 @@
+"""
+Shared type definitions for Python skills.
+
+SkillDefinition is the contract between a skill package (skills-py/<name>/)
+and the host runtime: it declares the tools the AI can call, lifecycle
+hooks, runtime-configurable options, and the entity schema the skill
+publishes.
+
+Usage:
+    from dev.types.skill_types import SkillDefinition, SkillHooks, SkillTool
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Protocol
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Async hook / execute function signature. Hooks receive a SkillContext as
+# their first argument; tool execute functions receive the args dict.
+HookFn = Callable[..., Awaitable[Any]]
+
+
+# ---------------------------------------------------------------------------
+# Tools
+# ---------------------------------------------------------------------------
+
+
+class ToolResult(BaseModel):
+  """Result returned by a tool execute function."""
+
+  content: str
+  is_error: bool = False
+
+
+class ToolDefinition(BaseModel):
+  """JSON-Schema-described tool exposed to the AI."""
+
+  name: str
+  description: str
+  parameters: dict[str, Any] = Field(default_factory=dict)
+
+
+class SkillTool(BaseModel):
+  """A tool definition paired with its async execute function."""
+
+  model_config = ConfigDict(arbitrary_types_allowed=True)
+
+  definition: ToolDefinition
+  execute: HookFn
+
+
+# ---------------------------------------------------------------------------
+# Options
+# ---------------------------------------------------------------------------
+
+
+class SkillOptionDefinition(BaseModel):
+  """Runtime-configurable option surfaced in the host UI."""
+
+  name: str
+  type: str
+  label: str
+  description: str = ""
+  default: Any = None
+  group: str = ""
+  tool_filter: list[str] | None = None
+
+
+# ---------------------------------------------------------------------------
+# Entity schema
+# ---------------------------------------------------------------------------
+
+
+class EntityPropertySchema(BaseModel):
+  """A single property on an entity type."""
+
+  name: str
+  type: str
+  description: str = ""
+  optional: bool = False
+
+
+class EntityTypeDeclaration(BaseModel):
+  """An entity type the skill publishes to the host knowledge graph."""
+
+  type: str
+  label: str
+  description: str = ""
+  properties: list[EntityPropertySchema] = Field(default_factory=list)
+
+
+class RelationshipTypeDeclaration(BaseModel):
+  """A relationship between two declared entity types."""
+
+  type: str
+  source_type: str
+  target_type: str
+  description: str = ""
+  cardinality: str = "many_to_many"
+
+
+class EntitySchema(BaseModel):
+  """Full entity/relationship schema declared by a skill."""
+
+  entity_types: list[EntityTypeDeclaration] = Field(default_factory=list)
+  relationship_types: list[RelationshipTypeDeclaration] = Field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Hooks + definition
+# ---------------------------------------------------------------------------
+
+
+class SkillHooks(BaseModel):
+  """Lifecycle hooks a skill may implement. All hooks are async."""
+
+  model_config = ConfigDict(arbitrary_types_allowed=True)
+
+  on_load: HookFn | None = None
+  on_unload: HookFn | None = None
+  on_session_start: HookFn | None = None
+  on_session_end: HookFn | None = None
+  on_before_message: HookFn | None = None
+  on_after_response: HookFn | None = None
+  on_tick: HookFn | None = None
+  on_status: HookFn | None = None
+  on_memory_flush: HookFn | None = None
+  on_setup_start: HookFn | None = None
+  on_setup_submit: HookFn | None = None
+  on_setup_cancel: HookFn | None = None
+  on_disconnect: HookFn | None = None
+
+
+class SkillDefinition(BaseModel):
+  """Top-level skill declaration; every skill.py exports one as `skill`."""
+
+  model_config = ConfigDict(arbitrary_types_allowed=True)
+
+  name: str
+  description: str
+  version: str
+  tools: list[SkillTool] = Field(default_factory=list)
+  hooks: SkillHooks | None = None
+  options: list[SkillOptionDefinition] = Field(default_factory=list)
+  tick_interval: int | None = None  # milliseconds
+  entity_schema: EntitySchema | None = None
+  has_setup: bool = False
+  has_disconnect: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Runtime context
+# ---------------------------------------------------------------------------
+
+
+class SkillContext(Protocol):
+  """Runtime context handed to skill hooks by the SkillServer.
+
+  The concrete implementation lives in dev.runtime.server; skills should
+  only depend on this surface.
+  """
+
+  data_dir: str
+  memory: Any
+  session: Any
+  entities: Any
+
+  def log(self, message: str) -> None: ...
+
+  def get_state(self) -> dict[str, Any]: ...
+
+  def set_state(self, partial: dict[str, Any]) -> None: ...
+
+  async def read_data(self, filename: str) -> str | None: ...
+
+  async def write_data(self, filename: str, content: str) -> None: ...
@@ -0,0 +1 @@
+# Static validation for skills-py skill packages
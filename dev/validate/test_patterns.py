@@ -0,0 +1,78 @@
+"""
+Equivalence tests for the ASCII-walk name/version checks in validator.py.
+
+The walks replaced NAME_PATTERN / SEMVER_PATTERN on the hot path; these
+tests pin them to the patterns they replaced so a divergence shows up as
+a test failure instead of a wrong validation verdict.
+
+Run with: python -m pytest dev/validate/test_patterns.py
+     or: python -m dev.validate.test_patterns
+"""
+
+from __future__ import annotations
+
+import itertools
+
+from dev.validate.validator import (
+  NAME_PATTERN,
+  SEMVER_PATTERN,
+  _compiled_name_ok,
+  _semver_ok,
+)
+
+NAME_CASES = [
+  "",
+  "a",
+  "abc",
+  "a1",
+  "1a",
+  "a-b",
+  "a--b",
+  "-a",
+  "a-",
+  "kebab-case-name",
+  "UPPER",
+  "mixedCase",
+  "with_underscore",
+  "with.dot",
+  "a-1-b2",
+  "trailing-hyphen-",
+  "héllo",
+]
+
+VERSION_CASES = [
+  "",
+  "1",
+  "1.2",
+  "1.2.3",
+  "0.0.0",
+  "10.20.30",
+  "1.2.3-beta",
+  "1.2.3.4",
+  "1..3",
+  ".1.2",
+  "1.2.",
+  "a.b.c",
+  "1.2.x",
+  "v1.2.3",
+]
+
+
+def test_name_walk_matches_pattern() -> None:
+  # Exhaustive over short alphabet strings plus the curated edge cases.
+  alphabet = "ab1-"
+  short = ("".join(t) for n in range(4) for t in itertools.product(alphabet, repeat=n))
+  for name in itertools.chain(NAME_CASES, short):
+    _compiled_name_ok.cache_clear()
+    assert _compiled_name_ok(name) == (NAME_PATTERN.match(name) is not None), name
+
+
+def test_semver_walk_matches_pattern() -> None:
+  for version in VERSION_CASES:
+    assert _semver_ok(version) == (SEMVER_PATTERN.match(version) is not None), version
+
+
+if __name__ == "__main__":
+  test_name_walk_matches_pattern()
+  test_semver_walk_matches_pattern()
+  print("ok")
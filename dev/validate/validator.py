@@ -0,0 +1,445 @@
+"""
+Static validator for skills-py skill packages.
+
+Imports each skill.py, checks that it exports a valid SkillDefinition,
+and reports per-skill errors and warnings.
+
+Run from the repo root: python -m dev.validate.validator
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import types
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from dev.types.skill_types import SkillDefinition
+
+# Skill names: lowercase kebab-case. Versions: semver x.y.z prefix.
+NAME_PATTERN = re.compile(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$")
+SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+")
+
+# Core-schema validator bound once; skips the model_validate classmethod
+# wrapper on every call.
+_validator = SkillDefinition.__pydantic_validator__
+
+# Batch adapter, built lazily: validates a whole list of raw skill
+# objects in one core-schema call instead of N dispatches.
+_list_adapter: Any = None
+
+
+def batch_validate(skill_objs: list[Any]) -> list[str | None]:
+  """Validate many raw skill objects at once.
+
+  Returns one entry per input: None when valid, otherwise the error
+  text. The batch path amortizes Pydantic dispatch across the list;
+  when it raises, errors are demultiplexed by list index, falling back
+  to individual validation for objects the batch could not attribute.
+  """
+  global _list_adapter
+  if _list_adapter is None:
+    from pydantic import TypeAdapter
+
+    _list_adapter = TypeAdapter(list[SkillDefinition])
+  try:
+    _list_adapter.validate_python(skill_objs)
+    return [None] * len(skill_objs)
+  except Exception as batch_err:
+    bad_indexes = set()
+    for err in getattr(batch_err, "errors", lambda: [])():
+      loc = err.get("loc") or ()
+      if loc and isinstance(loc[0], int):
+        bad_indexes.add(loc[0])
+    out: list[str | None] = []
+    for i, obj in enumerate(skill_objs):
+      if bad_indexes and i not in bad_indexes:
+        out.append(None)
+        continue
+      try:
+        _validator.validate_python(obj)
+        out.append(None)
+      except Exception as e:
+        out.append(str(e))
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_name_ok(name: str) -> bool:
+  """Memoized kebab-case check; skill names are a small, repeated set.
+
+  A direct ASCII walk instead of the re engine; equivalence with
+  NAME_PATTERN is covered by test_patterns.py.
+  """
+  if not name or not ("a" <= name[0] <= "z"):
+    ok = False
+  else:
+    ok = True
+    prev_hyphen = False
+    for c in name[1:]:
+      if c == "-":
+        if prev_hyphen:
+          ok = False
+          break
+        prev_hyphen = True
+      elif "a" <= c <= "z" or "0" <= c <= "9":
+        prev_hyphen = False
+      else:
+        ok = False
+        break
+    else:
+      ok = ok and not prev_hyphen
+  return ok
+
+
+def _semver_ok(version: str) -> bool:
+  """ASCII walk for a digits.digits.digits prefix (suffix allowed)."""
+  i = 0
+  n = len(version)
+  for part in range(3):
+    start = i
+    while i < n and "0" <= version[i] <= "9":
+      i += 1
+    if i == start:
+      return False
+    if part < 2:
+      if i >= n or version[i] != ".":
+        return False
+      i += 1
+  return True
+
+VALID_HOOKS = frozenset({
+  "on_load",
+  "on_unload",
+  "on_session_start",
+  "on_session_end",
+  "on_before_message",
+  "on_after_response",
+  "on_tick",
+  "on_status",
+  "on_memory_flush",
+  "on_setup_start",
+  "on_setup_submit",
+  "on_setup_cancel",
+  "on_disconnect",
+})
+
+PASS = "✓"
+FAIL = "✗"
+
+
+def bold(s: str) -> str:
+  return f"\033[1m{s}\033[0m" if sys.stdout.isatty() else s
+
+
+@dataclass
+class SkillResult:
+  """Validation outcome for one skill."""
+
+  skill_name: str
+  errors: list[str] = field(default_factory=list)
+  warnings: list[str] = field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+
+def find_skill_dirs(base_dir: Path) -> list[Path]:
+  """Direct children of base_dir that contain a skill.py.
+
+  Uses os.scandir so the is_dir check comes from the cached DirEntry
+  instead of a second stat per child.
+  """
+  dirs: list[Path] = []
+  with os.scandir(base_dir) as it:
+    for e in it:
+      if e.name.startswith(".") or not e.is_dir(follow_symlinks=False):
+        continue
+      try:
+        os.stat(os.path.join(e.path, "skill.py"))
+      except FileNotFoundError:
+        continue
+      dirs.append(Path(e.path))
+  dirs.sort(key=lambda p: p.name)
+  return dirs
+
+
+def find_example_skill_dirs(base_dir: Path) -> list[Path]:
+  """Skill dirs up to two levels under base_dir (flat or per-category).
+
+  os.walk delivers each directory's file list, so skill.py membership is
+  a list check against already-loaded names — no exists() probes at all.
+  """
+  dirs: list[Path] = []
+  if not base_dir.is_dir():
+    return dirs
+  base = str(base_dir)
+  for root, subdirs, files in os.walk(base):
+    depth = 0 if root == base else os.path.relpath(root, base).count(os.sep) + 1
+    if depth > 2:
+      subdirs[:] = []
+      continue
+    subdirs[:] = [d for d in subdirs if not d.startswith(".")]
+    if depth and "skill.py" in files:
+      dirs.append(Path(root))
+  # Sort the filtered result once instead of sorting every directory
+  # listing along the way.
+  dirs.sort()
+  return dirs
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+def _import_skill_module(skill_py_path: Path, skill_name: str) -> Any:
+  """Import <skill_dir>/skill.py under a synthetic parent package.
+
+  Mirrors extract_skill_py in dev/build_catalog.py: the parent package
+  (created once per process and reused) gives each skill.py a real
+  package context, so intra-skill relative imports resolve without
+  mutating sys.path — importing the file as a top-level module named
+  `skill` broke every skill that uses them.
+  """
+  pkg = sys.modules.get("_skill_validate")
+  if pkg is None:
+    pkg = types.ModuleType("_skill_validate")
+    pkg.__path__ = [str(skill_py_path.resolve().parent.parent)]
+    sys.modules["_skill_validate"] = pkg
+
+  mod_name = f"_skill_validate.{skill_name}"
+  spec = importlib.util.spec_from_file_location(
+    mod_name, skill_py_path, submodule_search_locations=[str(skill_py_path.parent)]
+  )
+  if spec is None or spec.loader is None:
+    return None
+  module = importlib.util.module_from_spec(spec)
+  module.__package__ = mod_name
+  sys.modules[mod_name] = module
+  try:
+    spec.loader.exec_module(module)
+  except Exception:
+    sys.modules.pop(mod_name, None)
+    raise
+  return module
+
+
+def validate_skill_py(skill_py_path: Path | str, skill_name: str) -> SkillResult:
+  """Import a skill.py and validate its exported SkillDefinition."""
+  skill_py_path = Path(skill_py_path)
+  result = SkillResult(skill_name=skill_name)
+
+  # The repo root must already be on sys.path (main() inserts it once;
+  # skill-runtime callers inherit it from the host) so skills can import
+  # dev.* absolutely.
+  try:
+    module = _import_skill_module(skill_py_path, skill_name)
+  except Exception as e:
+    result.errors.append(f"Import failed: {e}")
+    return result
+  if module is None:
+    result.errors.append(f"Cannot build import spec for {skill_py_path}")
+    return result
+
+  # Direct namespace lookup; skips attribute machinery and any PEP 562
+  # module __getattr__ a skill might define.
+  skill_obj = module.__dict__.get("skill")
+  if skill_obj is None:
+    result.errors.append("skill.py does not export a module-level `skill`")
+    return result
+
+  if not isinstance(skill_obj, SkillDefinition):
+    try:
+      skill_obj = _validator.validate_python(skill_obj)
+    except Exception as e:
+      result.errors.append(f"`skill` is not a valid SkillDefinition: {e}")
+      return result
+  skill = skill_obj
+
+  # --- metadata ---
+  if not _compiled_name_ok(skill.name):
+    result.errors.append(f"Invalid skill name {skill.name!r} (want kebab-case)")
+  if skill.name != skill_name:
+    result.warnings.append(
+      f"Skill name {skill.name!r} does not match directory name {skill_name!r}"
+    )
+  if not _semver_ok(skill.version):
+    result.errors.append(f"Invalid version {skill.version!r} (want x.y.z)")
+  if not skill.description.strip():
+    result.errors.append("Empty description")
+
+  # --- hooks ---
+  # One getattr pass over the fixed hook set; no Pydantic serialization.
+  # Unknown hooks cannot exist on the SkillHooks model, so there is no
+  # unknown-hook warning path.
+  if skill.hooks is not None:
+    for hook_name in VALID_HOOKS:
+      hook_fn = getattr(skill.hooks, hook_name, None)
+      if hook_fn is not None and not callable(hook_fn):
+        result.errors.append(f"Hook {hook_name} is not callable")
+
+  # --- tools ---
+  # Duplicates are counted once up front; the loop only reports each
+  # duplicated name a single time instead of tracking a seen-set per tool.
+  dup_counts = Counter(
+    t.definition.name for t in skill.tools if t.definition and t.definition.name
+  )
+  reported_dups: set[str] = set()
+  for i, tool in enumerate(skill.tools):
+    defn = tool.definition
+    if defn is None or not defn.name:
+      result.errors.append(f"Tool #{i} has no name")
+      continue
+    if dup_counts[defn.name] > 1 and defn.name not in reported_dups:
+      result.errors.append(f"Duplicate tool name {defn.name!r}")
+      reported_dups.add(defn.name)
+    if not defn.description.strip():
+      result.warnings.append(f"Tool {defn.name!r} has no description")
+    if defn.parameters and defn.parameters.get("type") != "object":
+      result.warnings.append(f"Tool {defn.name!r} parameters should be an object schema")
+    if not callable(tool.execute):
+      result.errors.append(f"Tool {defn.name!r} execute is not callable")
+
+  # --- setup contract ---
+  if skill.has_setup and (
+    skill.hooks is None
+    or skill.hooks.on_setup_start is None
+    or skill.hooks.on_setup_submit is None
+  ):
+    result.errors.append("has_setup=True requires on_setup_start and on_setup_submit")
+
+  return result
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _load_cache(cache_path: Path) -> dict[str, Any]:
+  try:
+    with open(cache_path, encoding="utf-8") as f:
+      cache = json.load(f)
+  except (OSError, ValueError):
+    return {}
+  return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache_path: Path, cache: dict[str, Any]) -> None:
+  try:
+    with open(cache_path, "w", encoding="utf-8") as f:
+      json.dump(cache, f)
+  except OSError:
+    pass  # cache is best-effort; never fail the run over it
+
+
+def _validate_one(args: tuple[str, str]) -> SkillResult:
+  """Pool worker: validate one skill.py in its own interpreter.
+
+  Each worker imports skill.py in a fresh process, so the sys.path side
+  effect of the import never pollutes a shared interpreter.
+  """
+  skill_py, skill_name = args
+  return validate_skill_py(skill_py, skill_name)
+
+
+def main() -> None:
+  root_dir = Path(__file__).resolve().parent.parent.parent / "skills-py"
+  # One-time import setup, amortized over the whole run: skills import
+  # dev.* from the repo root, and the finder caches are refreshed once
+  # instead of per skill.
+  sys.path.insert(0, str(root_dir.parent))
+  importlib.invalidate_caches()
+  skill_dirs = find_skill_dirs(root_dir)
+  skill_dirs += find_example_skill_dirs(root_dir / "examples")
+
+  # Incremental skip cache: skills whose skill.py fingerprint (mtime_ns,
+  # size) is unchanged reuse last run's errors/warnings, so repeat runs
+  # cost O(changed skills) instead of O(total).
+  cache_path = root_dir / ".validator_cache.json"
+  cache = _load_cache(cache_path)
+  results: list[SkillResult | None] = [None] * len(skill_dirs)
+  to_validate: list[int] = []
+  sigs: dict[str, list[int]] = {}
+  for i, skill_dir in enumerate(skill_dirs):
+    key = str(skill_dir / "skill.py")
+    try:
+      st = os.stat(key)
+    except OSError:
+      to_validate.append(i)
+      continue
+    sigs[key] = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(key)
+    if entry is not None and entry.get("sig") == sigs[key]:
+      results[i] = SkillResult(
+        skill_name=skill_dir.name,
+        errors=list(entry.get("errors", [])),
+        warnings=list(entry.get("warnings", [])),
+      )
+    else:
+      to_validate.append(i)
+
+  # Skill imports are independent; fan validation out across cores and
+  # print results in submission order.
+  if to_validate:
+    with ProcessPoolExecutor() as pool:
+      fresh = pool.map(
+        _validate_one,
+        [(str(skill_dirs[i] / "skill.py"), skill_dirs[i].name) for i in to_validate],
+      )
+      for i, result in zip(to_validate, fresh):
+        results[i] = result
+
+  for skill_dir, result in zip(skill_dirs, results):
+    key = str(skill_dir / "skill.py")
+    if key in sigs:
+      cache[key] = {
+        "sig": sigs[key],
+        "errors": result.errors,
+        "warnings": result.warnings,
+      }
+  _write_cache(cache_path, cache)
+
+  total_errors = 0
+  total_warnings = 0
+  # All skill dirs are under root_dir, so a fixed-length slice replaces
+  # the part-by-part walk (and Path allocation) of Path.relative_to.
+  root_prefix_len = len(str(root_dir)) + len(os.sep)
+  for skill_dir, result in zip(skill_dirs, results):
+    rel_path = str(skill_dir)[root_prefix_len:]
+    # One write syscall per skill instead of one per line.
+    buf = [bold(f"  {rel_path}")]
+    for err in result.errors:
+      buf.append(f"    {FAIL} {err}")
+    for warn in result.warnings:
+      buf.append(f"    ! {warn}")
+    if not result.errors:
+      buf.append(f"    {PASS} ok")
+    sys.stdout.write("\n".join(buf) + "\n\n")
+    total_errors += len(result.errors)
+    total_warnings += len(result.warnings)
+
+  print(f"{len(skill_dirs)} skills, {total_errors} errors, {total_warnings} warnings")
+  if os.environ.get("VALIDATOR_CLEAN_EXIT"):
+    sys.exit(1 if total_errors else 0)
+  # Skip interpreter teardown: every imported skill module pins Pydantic
+  # schemas whose finalization costs real time and buys nothing here.
+  sys.stdout.flush()
+  sys.stderr.flush()
+  os._exit(1 if total_errors else 0)
+
+
+if __name__ == "__main__":
+  main()
@@ -4,12 +4,14 @@ CCXT client wrapper for managing multiple exchange connections.
 
 from .ccxt_client import (
   CcxtManager,
+  ExchangeConfig,
   create_ccxt_manager,
   get_ccxt_manager,
 )
 
 __all__ = [
   "CcxtManager",
+  "ExchangeConfig",
   "create_ccxt_manager",
   "get_ccxt_manager",
 ]
@@ -7,22 +7,194 @@ API keys and configuration.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Any
 
 import ccxt
+import ccxt.async_support as ccxt_async
+import requests
+from requests.adapters import HTTPAdapter
 
 log = logging.getLogger("skill.ccxt.client")
 
+# One manager per process. A plain module global is deliberate: the
+# SkillServer runs each inbound message in its own task, so a ContextVar
+# set during skill/load would be invisible to later tools/call tasks.
+# Assignment to a global is atomic under the GIL, which is all the
+# concurrency safety a single-slot singleton needs.
 _manager: CcxtManager | None = None
 
+# Market maps change rarely; refetch at most once a day per venue.
+_MARKETS_CACHE_TTL = 86400.0
+
+# Sentinel distinguishing "absent" from any stored value in dict.pop.
+_MISSING = object()
+
+
+# orjson parses the multi-megabyte markets blobs several times faster
+# than stdlib json and works on bytes directly; fall back when missing.
+try:
+  import orjson
+
+  def _loads(data: bytes) -> Any:
+    return orjson.loads(data)
+
+  def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj)
+except ImportError:
+  import json
+
+  def _loads(data: bytes) -> Any:
+    return json.loads(data)
+
+  def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+# Case-insensitive name -> class map built once at import: one dict
+# probe per add instead of getattr-with-fallback and re-lowercasing.
+_EXCHANGE_CLASSES: dict[str, type[ccxt.Exchange]] = {
+  name.lower(): getattr(ccxt, name) for name in ccxt.exchanges
+}
+
+# Parallel map for ccxt.async_support: async exchanges overlap their
+# HTTP requests, so N-venue fan-outs cost max(latency), not the sum.
+_ASYNC_EXCHANGE_CLASSES: dict[str, type[ccxt_async.Exchange]] = {
+  name.lower(): getattr(ccxt_async, name) for name in ccxt_async.exchanges
+}
+
+# ccxt.exchanges is a module constant; sort it once, not per tool call.
+_AVAILABLE_EXCHANGES: tuple[str, ...] = tuple(sorted(ccxt.exchanges))
+
+
+# Fixed-shape config record: slots drop the per-entry __dict__ and make
+# list_exchanges a tight attribute-access loop instead of dict probes.
+@dataclass(slots=True, frozen=True)
+class ExchangeConfig:
+  exchange_id: str
+  exchange_name: str
+  api_key: str
+  secret: str
+  password: str
+  sandbox: bool
+  options: Mapping[str, Any]
+  settings: tuple[dict[str, Any], ...] | None = None
+
 
 class CcxtManager:
   """Manages multiple CCXT exchange instances."""
 
-  def __init__(self) -> None:
+  def __init__(
+    self, markets_cache_dir: Path | None = None, quiet: bool = False
+  ) -> None:
+    # quiet=True downgrades per-connection info lines to debug so bulk
+    # provisioning does not serialize on the logging lock.
+    self._log_info = log.debug if quiet else log.info
     self._exchanges: dict[str, ccxt.Exchange] = {}
-    self._configs: dict[str, dict[str, Any]] = {}
+    # Validated-but-unbuilt connections: (class, ccxt config). Exchange
+    # construction (including ccxt's large static market metadata) is
+    # deferred to the first get_exchange, so never-queried connections
+    # cost two dict entries instead of a full Exchange object.
+    self._pending: dict[str, tuple[type[ccxt.Exchange], dict[str, Any]]] = {}
+    self._configs: dict[str, ExchangeConfig] = {}
+    # Connection ids backed by ccxt.async_support classes; these skip
+    # the shared requests.Session and participate in call_all fan-outs.
+    self._async_ids: set[str] = set()
+    # Memoized list_exchanges payload; None means rebuild. Invalidated
+    # on add/remove so steady-state polling is O(1).
+    self._list_cache: tuple[dict[str, Any], ...] | None = None
+    self._markets_cache_dir = (
+      markets_cache_dir or Path.home() / ".cache" / "ccxt-skill" / "markets"
+    )
+    # All exchange instances share one HTTP session so keep-alive
+    # sockets and TLS handshakes are pooled across connections to the
+    # same venue instead of fragmented per instance.
+    self._session = requests.Session()
+    self._session.mount(
+      "https://", HTTPAdapter(pool_connections=40, pool_maxsize=100)
+    )
+    # One markets tuple per venue, shared by reference: 50 connections
+    # to the same exchange hold one set of symbol dicts, not 50 copies.
+    self._shared_markets: dict[str, tuple[dict, dict, list, dict]] = {}
+    try:
+      self._markets_cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+      log.warning("Cannot create markets cache dir %s", self._markets_cache_dir)
+
+  def _share_markets(self, exchange: ccxt.Exchange, venue: str) -> None:
+    """Publish this instance's market maps for later instances to reuse."""
+    self._shared_markets[venue] = (
+      exchange.markets,
+      exchange.markets_by_id,
+      exchange.symbols,
+      exchange.currencies,
+    )
+
+  def _prime_markets(self, exchange: ccxt.Exchange, exchange_name: str) -> None:
+    """
+    Seed exchange market maps from an in-memory sibling or the per-venue
+    disk cache, or arrange for the first load_markets() to populate both.
+
+    Each venue's markets are identical across connections, so loading
+    them once a day per venue (instead of once per instance) saves an
+    HTTP round-trip plus a large JSON parse on every subsequent add.
+    """
+    venue = exchange_name.lower()
+    shared = self._shared_markets.get(venue)
+    if shared is not None:
+      # No copy and no deserialization: bind the same objects.
+      (
+        exchange.markets,
+        exchange.markets_by_id,
+        exchange.symbols,
+        exchange.currencies,
+      ) = shared
+      return
+
+    cache_path = self._markets_cache_dir / f"{venue}.json"
+    try:
+      if time.time() - cache_path.stat().st_mtime < _MARKETS_CACHE_TTL:
+        data = _loads(cache_path.read_bytes())
+        exchange.markets = data["markets"]
+        # Blobs persist markets_by_id so restore is pure assignment;
+        # fall back to index_by for blobs written before that.
+        exchange.markets_by_id = data.get("markets_by_id") or exchange.index_by(
+          data["markets"], "id"
+        )
+        exchange.symbols = sorted(exchange.markets)
+        exchange.currencies = data["currencies"]
+        self._share_markets(exchange, venue)
+        return
+    except (OSError, ValueError, KeyError):
+      pass  # Missing, stale, or corrupt cache: fall through to lazy load.
+
+    # Wrap load_markets so the first real fetch refreshes both caches.
+    orig_load_markets = exchange.load_markets
+
+    def load_and_cache(reload: bool = False, params: dict | None = None) -> Any:
+      markets = orig_load_markets(reload, params or {})
+      self._share_markets(exchange, venue)
+      try:
+        cache_path.write_bytes(
+          _dumps(
+            {
+              "markets": exchange.markets,
+              "markets_by_id": exchange.markets_by_id,
+              "currencies": exchange.currencies,
+              "ts": time.time(),
+            }
+          )
+        )
+      except (OSError, TypeError):
+        log.debug("Could not write markets cache for %s", exchange_name)
+      return markets
+
+    exchange.load_markets = load_and_cache
 
   def add_exchange(
     self,
@@ -34,6 +206,7 @@ class CcxtManager:
     sandbox: bool = False,
     options: dict[str, Any] | None = None,
     settings: list[dict[str, Any]] | None = None,
+    async_mode: bool = False,
   ) -> bool:
     """
     Add or update an exchange connection.
@@ -47,19 +220,18 @@ class CcxtManager:
         sandbox: Use sandbox/testnet mode
         options: Additional exchange-specific options (dict)
         settings: Array of setting objects to merge into options
+        async_mode: Back the connection with ccxt.async_support
 
     Returns:
         True if successful, False otherwise
     """
     try:
       # Get exchange class
-      exchange_class = getattr(ccxt, exchange_name.lower(), None)
+      classes = _ASYNC_EXCHANGE_CLASSES if async_mode else _EXCHANGE_CLASSES
+      exchange_class = classes.get(exchange_name.lower())
       if not exchange_class:
-        # Try with proper case
-        exchange_class = getattr(ccxt, exchange_name, None)
-        if not exchange_class:
-          log.error("Exchange %s not found in CCXT", exchange_name)
-          return False
+        log.error("Exchange %s not found in CCXT", exchange_name)
+        return False
 
       # Merge settings array into options if provided
       merged_options = dict(options or {})
@@ -73,83 +245,169 @@ class CcxtManager:
               # Otherwise merge all keys from the object
               merged_options.update(setting_obj)
 
-      # Build config
+      # Build config as one literal with a fixed key set: empty
+      # password/sandbox are no-ops in ccxt's constructor, and the
+      # identical shape across calls lets CPython share the dict keys.
       config: dict[str, Any] = {
         "apiKey": api_key,
         "secret": secret,
+        "password": password,
+        "sandbox": sandbox,
         "enableRateLimit": True,
         "options": merged_options,
       }
 
-      if password:
-        config["password"] = password
-
-      if sandbox:
-        config["sandbox"] = True
-
-      # Create exchange instance
-      exchange = exchange_class(config)
-
-      # Test connection (optional - just check if exchange is available)
-      if not hasattr(exchange, "load_markets"):
+      # Sanity check on the class (optional - instance made lazily)
+      if not hasattr(exchange_class, "load_markets"):
         log.error("Exchange %s does not support load_markets", exchange_name)
         return False
 
-      # Store exchange and config
-      self._exchanges[exchange_id] = exchange
-      self._configs[exchange_id] = {
-        "exchange_id": exchange_id,
-        "exchange_name": exchange_name,
-        "api_key": api_key,
-        "secret": secret,
-        "password": password,
-        "sandbox": sandbox,
-        "options": merged_options,
-        "settings": settings,  # Store raw settings array if provided
-      }
-
-      log.info("Added exchange %s (%s)", exchange_id, exchange_name)
+      # Defer construction to first use: store the resolved class and
+      # config, drop any previously built instance for this id.
+      self._exchanges.pop(exchange_id, None)
+      self._pending[exchange_id] = (exchange_class, config)
+      if async_mode:
+        self._async_ids.add(exchange_id)
+      else:
+        self._async_ids.discard(exchange_id)
+      self._configs[exchange_id] = ExchangeConfig(
+        exchange_id=exchange_id,
+        exchange_name=exchange_name,
+        api_key=api_key,
+        secret=secret,
+        password=password,
+        sandbox=sandbox,
+        options=merged_options,
+        settings=tuple(settings) if settings else None,
+      )
+      self._list_cache = None
+
+      self._log_info("Added exchange %s (%s)", exchange_id, exchange_name)
       return True
 
-    except Exception as e:
-      log.exception("Failed to add exchange %s: %s", exchange_id, e)
+    except Exception:
+      # Guard: traceback capture is not free when error logging is off.
+      if log.isEnabledFor(logging.ERROR):
+        log.exception("Failed to add exchange %s", exchange_id)
       return False
 
+  def add_exchanges(self, specs: list[dict[str, Any]]) -> list[bool]:
+    """
+    Batch-register connections, amortizing per-venue work.
+
+    Each spec is a dict of add_exchange keyword arguments. Specs are
+    grouped by venue so unknown venues are rejected (and logged) once
+    for the whole group; class lookup, the HTTP pool, and the shared
+    markets maps are amortized across the batch, so N connections to
+    one venue pay for a single load_markets on first use.
+
+    Returns one bool per spec, in input order.
+    """
+    results: list[bool] = [False] * len(specs)
+    by_venue: defaultdict[str, list[int]] = defaultdict(list)
+    for i, spec in enumerate(specs):
+      by_venue[str(spec.get("exchange_name", "")).lower()].append(i)
+    for venue, indices in by_venue.items():
+      if venue not in _EXCHANGE_CLASSES and venue not in _ASYNC_EXCHANGE_CLASSES:
+        log.error("Exchange %s not found in CCXT", venue)
+        continue
+      for i in indices:
+        results[i] = self.add_exchange(**specs[i])
+    return results
+
   def remove_exchange(self, exchange_id: str) -> bool:
     """Remove an exchange connection."""
-    if exchange_id in self._exchanges:
-      del self._exchanges[exchange_id]
-      del self._configs[exchange_id]
-      log.info("Removed exchange %s", exchange_id)
-      return True
-    return False
+    # pop-with-sentinel: one hash probe instead of `in` + `del`.
+    if self._configs.pop(exchange_id, _MISSING) is _MISSING:
+      return False
+    self._exchanges.pop(exchange_id, None)
+    self._pending.pop(exchange_id, None)
+    self._async_ids.discard(exchange_id)
+    self._list_cache = None
+    self._log_info("Removed exchange %s", exchange_id)
+    return True
 
   def get_exchange(self, exchange_id: str) -> ccxt.Exchange | None:
-    """Get an exchange instance by ID."""
-    return self._exchanges.get(exchange_id)
+    """Get an exchange instance by ID, building it on first use."""
+    exchange = self._exchanges.get(exchange_id)
+    if exchange is None:
+      pending = self._pending.pop(exchange_id, None)
+      if pending is None:
+        return None
+      exchange_class, config = pending
+      exchange = exchange_class(config)
+      if exchange_id not in self._async_ids:
+        # ccxt's sync base issues requests through self.session; point
+        # it at the shared pool. Async exchanges manage their own
+        # aiohttp session, and the cache wrapper cannot wrap their
+        # coroutine load_markets, so both steps are sync-only.
+        exchange.session = self._session
+        self._prime_markets(exchange, self._configs[exchange_id].exchange_name)
+      self._exchanges[exchange_id] = exchange
+    return exchange
+
+  async def call_all(self, method: str, *args: Any, **kwargs: Any) -> list[Any]:
+    """
+    Fan one method call out across all async exchanges concurrently.
+
+    Returns results in async-connection order; failures come back as
+    exception objects rather than raising (return_exceptions=True), so
+    one slow or broken venue cannot sink the batch. Total latency is
+    the max of the per-venue round-trips instead of their sum.
+    """
+    exchanges = [self.get_exchange(eid) for eid in sorted(self._async_ids)]
+    return await asyncio.gather(
+      *(
+        getattr(ex, method)(*args, **kwargs)
+        for ex in exchanges
+        if ex is not None
+      ),
+      return_exceptions=True,
+    )
 
   def list_exchanges(self) -> list[dict[str, Any]]:
     """List all configured exchanges."""
-    return [
-      {
-        "exchange_id": config["exchange_id"],
-        "exchange_name": config["exchange_name"],
-        "sandbox": config.get("sandbox", False),
-      }
-      for config in self._configs.values()
-    ]
-
-  def get_config(self, exchange_id: str) -> dict[str, Any] | None:
+    if self._list_cache is None:
+      self._list_cache = tuple(
+        {
+          "exchange_id": c.exchange_id,
+          "exchange_name": c.exchange_name,
+          "sandbox": c.sandbox,
+        }
+        for c in self._configs.values()
+      )
+    # Per-entry copies: callers may mutate what they get back, and the
+    # cached dicts must stay pristine for the next call.
+    return [dict(entry) for entry in self._list_cache]
+
+  def get_config(self, exchange_id: str) -> ExchangeConfig | None:
     """Get configuration for an exchange."""
     return self._configs.get(exchange_id)
 
+  def update_options(
+    self,
+    exchange_id: str,
+    options: dict[str, Any],
+    settings: list[dict[str, Any]] | None = None,
+  ) -> bool:
+    """Replace the stored options (and raw settings) for an exchange."""
+    config = self._configs.get(exchange_id)
+    if config is None:
+      return False
+    self._configs[exchange_id] = replace(
+      config,
+      options=options,
+      settings=tuple(settings) if settings else config.settings,
+    )
+    return True
+
   def has_exchange(self, exchange_id: str) -> bool:
     """Check if an exchange is configured."""
-    return exchange_id in self._exchanges
+    return exchange_id in self._configs
 
   def get_available_exchanges(self) -> list[str]:
     """Get list of all available CCXT exchange names."""
-    return sorted(ccxt.exchanges)
+    return list(_AVAILABLE_EXCHANGES)
 
 
 def create_ccxt_manager() -> CcxtManager:
@@ -57,10 +57,10 @@ async def get_exchange_info(args: dict[str, Any]) -> ToolResult:
       )
 
     lines = [
-      f"Exchange ID: {config['exchange_id']}",
-      f"Exchange Name: {config['exchange_name']}",
-      f"Sandbox Mode: {config.get('sandbox', False)}",
-      f"API Key: {'*' * 8 if config.get('api_key') else 'Not set'}",
+      f"Exchange ID: {config.exchange_id}",
+      f"Exchange Name: {config.exchange_name}",
+      f"Sandbox Mode: {config.sandbox}",
+      f"API Key: {'*' * 8 if config.api_key else 'Not set'}",
     ]
 
     return ToolResult(content="\n".join(lines))
@@ -138,7 +138,7 @@ async def update_exchange_settings(args: dict[str, Any]) -> ToolResult:
       )
 
     # Merge settings array into options
-    current_options = dict(config.get("options", {}))
+    current_options = dict(config.options)
     for setting_obj in settings:
       if isinstance(setting_obj, dict):
         # If it's an object with "key" and "value", use that structure
@@ -155,8 +155,7 @@ async def update_exchange_settings(args: dict[str, Any]) -> ToolResult:
       exchange.options.update(current_options)
 
     # Update stored config
-    config["options"] = current_options
-    config["settings"] = settings
+    manager.update_options(exchange_id, current_options, settings)
 
     lines = [
       f"Updated settings for {exchange_id}:",
@@ -6,44 +6,42 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
-account_tools: list[Tool] = [
+# Shared schema fragments: built once so the near-identical inputSchema
+# shapes reference the same dicts instead of reconstructing them per
+# Tool, and stay identity-equal for downstream caches.
+_EXCHANGE_ID_PROP = {
+  "type": "string",
+  "description": "The exchange connection ID",
+}
+
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+_EXCHANGE_ID_SCHEMA = {
+  "type": "object",
+  "properties": {"exchange_id": _EXCHANGE_ID_PROP},
+  "required": ["exchange_id"],
+}
+
+account_tools: tuple[Tool, ...] = (
   Tool(
     name="list_exchanges",
     description="List all configured exchange connections",
-    inputSchema={"type": "object", "properties": {}},
+    inputSchema=_EMPTY_SCHEMA,
   ),
   Tool(
     name="get_exchange_info",
     description="Get information about a specific exchange connection",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "exchange_id": {
-          "type": "string",
-          "description": "The exchange connection ID",
-        },
-      },
-      "required": ["exchange_id"],
-    },
+    inputSchema=_EXCHANGE_ID_SCHEMA,
   ),
   Tool(
     name="test_connection",
     description="Test connection to an exchange",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "exchange_id": {
-          "type": "string",
-          "description": "The exchange connection ID",
-        },
-      },
-      "required": ["exchange_id"],
-    },
+    inputSchema=_EXCHANGE_ID_SCHEMA,
   ),
   Tool(
     name="get_available_exchanges",
     description="List all available CCXT exchange names",
-    inputSchema={"type": "object", "properties": {}},
+    inputSchema=_EMPTY_SCHEMA,
   ),
   Tool(
     name="update_exchange_settings",
@@ -51,10 +49,7 @@ account_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "exchange_id": {
-          "type": "string",
-          "description": "The exchange connection ID",
-        },
+        "exchange_id": _EXCHANGE_ID_PROP,
         "settings": {
           "type": "array",
           "description": "Array of setting objects to update. Each object can have key-value pairs or use 'key' and 'value' structure.",
@@ -67,4 +62,8 @@ account_tools: list[Tool] = [
       "required": ["exchange_id", "settings"],
     },
   ),
-]
+)
+
+# O(1) dispatch index built once at import; consumers should prefer
+# this over scanning account_tools by name per request.
+TOOL_BY_NAME: dict[str, Tool] = {t.name: t for t in account_tools}
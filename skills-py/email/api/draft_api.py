@@ -45,20 +45,14 @@ async def _find_drafts_folder() -> str:
   return "Drafts"
 
 
-async def save_draft(
+def _build_mime(
   to: list[str],
   subject: str,
   body: str,
   html_body: str | None = None,
   cc: list[str] | None = None,
-  bcc: list[str] | None = None,
-) -> bool:
-  """Save a draft to the Drafts folder."""
-  client = get_imap_client()
-  if not client or not await client.ensure_connected():
-    raise RuntimeError("IMAP not connected")
-
-  # Build the MIME message
+) -> bytes:
+  """Build the raw MIME bytes for a draft."""
   from email.mime.multipart import MIMEMultipart
   from email.mime.text import MIMEText
 
@@ -75,12 +69,60 @@ async def save_draft(
   if cc:
     msg["Cc"] = ", ".join(cc)
 
+  return msg.as_bytes()
+
+
+async def save_draft(
+  to: list[str],
+  subject: str,
+  body: str,
+  html_body: str | None = None,
+  cc: list[str] | None = None,
+  bcc: list[str] | None = None,
+) -> bool:
+  """Save a draft to the Drafts folder."""
+  client = get_imap_client()
+  if not client or not await client.ensure_connected():
+    raise RuntimeError("IMAP not connected")
+
   drafts_folder = await _find_drafts_folder()
-  raw = msg.as_bytes()
+  raw = _build_mime(to, subject, body, html_body, cc)
 
   return await client.append_message(drafts_folder, raw, r"(\Draft \Seen)")
 
 
+async def save_drafts_bulk(items: list[dict]) -> list[dict]:
+  """Save several drafts in one pass.
+
+  Each item is a dict with the same keys as save_draft (to, subject,
+  body, optional html_body/cc). The connection check and drafts-folder
+  lookup happen once for the whole batch instead of once per draft, and
+  a failed item is recorded in its result rather than aborting the rest.
+  """
+  client = get_imap_client()
+  if not client or not await client.ensure_connected():
+    raise RuntimeError("IMAP not connected")
+
+  drafts_folder = await _find_drafts_folder()
+
+  results: list[dict] = []
+  for item in items:
+    try:
+      raw = _build_mime(
+        item["to"],
+        item.get("subject", ""),
+        item.get("body", ""),
+        item.get("html_body"),
+        item.get("cc"),
+      )
+      ok = await client.append_message(drafts_folder, raw, r"(\Draft \Seen)")
+      results.append({"ok": ok})
+    except Exception as exc:
+      log.debug("Failed to save draft in bulk", exc_info=True)
+      results.append({"ok": False, "error": str(exc)})
+  return results
+
+
 async def list_drafts(limit: int = 20) -> list[ParsedEmail]:
   """List draft messages."""
   client = get_imap_client()
@@ -6,9 +6,9 @@ from __future__ import annotations
 
 import logging
 
-from ..client.imap_client import get_imap_client
+from ..client.imap_client import ImapClient, get_imap_client
 from ..db.connection import get_db
-from ..db.queries import delete_cached_email, update_email_flags
+from ..db.queries import delete_cached_emails_batch, update_email_flags_batch
 
 log = logging.getLogger("skill.email.api.flag")
 
@@ -20,72 +20,45 @@ def set_account_id(account_id: str) -> None:
   _account_id = account_id
 
 
-async def _ensure_folder(folder: str) -> None:
-  """Select the folder on the IMAP client."""
+async def _ensure_folder(folder: str) -> ImapClient:
+  """Select the folder on the IMAP client and return the client."""
   client = get_imap_client()
   if not client or not await client.ensure_connected():
     raise RuntimeError("IMAP not connected")
   await client.select_folder(folder)
+  return client
 
 
-async def mark_read(uids: list[int], folder: str = "INBOX") -> bool:
-  """Mark messages as read (set \\Seen flag)."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
-  result = await client.store_flags(uids, r"(\Seen)", "+FLAGS")
+async def _store_and_sync(
+  uids: list[int], folder: str, imap_flag: str, op: str, **cache_flags: bool
+) -> bool:
+  """Shared STORE-then-cache-update skeleton for the flag operations."""
+  client = await _ensure_folder(folder)
+  result = await client.store_flags(uids, imap_flag, op)
   if result:
     db = await get_db()
-    for uid in uids:
-      await update_email_flags(db, _account_id, folder, uid, is_read=True)
+    await update_email_flags_batch(db, _account_id, folder, uids, **cache_flags)
   return result
 
 
+async def mark_read(uids: list[int], folder: str = "INBOX") -> bool:
+  """Mark messages as read (set \\Seen flag)."""
+  return await _store_and_sync(uids, folder, r"(\Seen)", "+FLAGS", is_read=True)
+
+
 async def mark_unread(uids: list[int], folder: str = "INBOX") -> bool:
   """Mark messages as unread (remove \\Seen flag)."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
-  result = await client.store_flags(uids, r"(\Seen)", "-FLAGS")
-  if result:
-    db = await get_db()
-    for uid in uids:
-      await update_email_flags(db, _account_id, folder, uid, is_read=False)
-  return result
+  return await _store_and_sync(uids, folder, r"(\Seen)", "-FLAGS", is_read=False)
 
 
 async def flag_message(uids: list[int], folder: str = "INBOX") -> bool:
   """Star/flag messages (set \\Flagged flag)."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
-  result = await client.store_flags(uids, r"(\Flagged)", "+FLAGS")
-  if result:
-    db = await get_db()
-    for uid in uids:
-      await update_email_flags(db, _account_id, folder, uid, is_flagged=True)
-  return result
+  return await _store_and_sync(uids, folder, r"(\Flagged)", "+FLAGS", is_flagged=True)
 
 
 async def unflag_message(uids: list[int], folder: str = "INBOX") -> bool:
   """Remove star/flag from messages."""
-  await _ensure_folder(folder)
-  client = get_imap_client()
-  if not client:
-    return False
-
-  result = await client.store_flags(uids, r"(\Flagged)", "-FLAGS")
-  if result:
-    db = await get_db()
-    for uid in uids:
-      await update_email_flags(db, _account_id, folder, uid, is_flagged=False)
-  return result
+  return await _store_and_sync(uids, folder, r"(\Flagged)", "-FLAGS", is_flagged=False)
 
 
 async def delete_message(uids: list[int], folder: str = "INBOX") -> bool:
@@ -113,8 +86,7 @@ async def delete_message(uids: list[int], folder: str = "INBOX") -> bool:
 
   # Update cache
   db = await get_db()
-  for uid in uids:
-    await delete_cached_email(db, _account_id, folder, uid)
+  await delete_cached_emails_batch(db, _account_id, folder, uids)
 
   return True
 
@@ -134,8 +106,7 @@ async def move_message(
   if result:
     await client.expunge()
     db = await get_db()
-    for uid in uids:
-      await delete_cached_email(db, _account_id, folder, uid)
+    await delete_cached_emails_batch(db, _account_id, folder, uids)
 
   return result
 
@@ -156,8 +127,7 @@ async def archive_message(uids: list[int], folder: str = "INBOX") -> bool:
       await client.expunge()
 
       db = await get_db()
-      for uid in uids:
-        await delete_cached_email(db, _account_id, folder, uid)
+      await delete_cached_emails_batch(db, _account_id, folder, uids)
       return True
 
   raise RuntimeError("Could not find Archive folder")
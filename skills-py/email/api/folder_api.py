@@ -35,7 +35,7 @@ async def get_folder_status(folder: str) -> dict[str, Any]:
   if not await client.ensure_connected():
     raise RuntimeError("IMAP not connected")
 
-  status = await client.select_folder(folder)
+  status = await client.select_folder(folder, refresh=True)
   if not status:
     raise RuntimeError(f"Cannot select folder: {folder}")
   return status
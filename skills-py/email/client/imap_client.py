@@ -10,6 +10,7 @@ import asyncio
 import contextlib
 import logging
 import re
+import time
 from typing import TYPE_CHECKING, Any
 
 from aioimaplib import IMAP4, IMAP4_SSL
@@ -23,6 +24,13 @@ log = logging.getLogger("skill.email.client.imap")
 
 _client: ImapClient | None = None
 
+# Seconds a connection is trusted after a successful command before
+# ensure_connected probes it with a NOOP again.
+_PROBE_INTERVAL = 30.0
+
+# Seconds the folder list is served from cache before LIST runs again.
+_FOLDERS_TTL = 60.0
+
 
 class ImapClient:
   """Async IMAP client with connection management."""
@@ -40,8 +48,14 @@ class ImapClient:
     self._email: str = ""
     self._password: str = ""
     self._current_folder: str | None = None
+    self._folder_info: dict[str, Any] | None = None
+    self._folders_cache: list[dict[str, str]] | None = None
+    self._folders_cached_at: float = 0.0
     self._lock = asyncio.Lock()
     self.is_connected: bool = False
+    # monotonic time of the last command the server answered OK;
+    # lets ensure_connected skip its NOOP probe on hot paths.
+    self._last_ok: float = 0.0
 
   async def connect(self, email: str, password: str) -> bool:
     """Connect and authenticate."""
@@ -52,6 +66,10 @@ class ImapClient:
   async def _do_connect(self) -> bool:
     """Internal connect logic."""
     async with self._lock:
+      # Single-flight: concurrent callers queue on the lock, so whoever
+      # reconnected first already did the work for the rest.
+      if self.is_connected and time.monotonic() - self._last_ok < _PROBE_INTERVAL:
+        return True
       try:
         if self.use_ssl:
           self._imap = IMAP4_SSL(host=self.host, port=self.port)
@@ -67,6 +85,8 @@ class ImapClient:
 
         self.is_connected = True
         self._current_folder = None
+        self._folder_info = None
+        self._last_ok = time.monotonic()
         log.info("IMAP connected to %s as %s", self.host, self._email)
         return True
       except Exception:
@@ -75,11 +95,20 @@ class ImapClient:
         return False
 
   async def ensure_connected(self) -> bool:
-    """Ensure the client is connected, reconnecting if needed."""
+    """Ensure the client is connected, reconnecting if needed.
+
+    A NOOP probe costs a full round-trip, so when the server answered a
+    command OK within the last _PROBE_INTERVAL seconds the connection is
+    assumed live and the probe is skipped; a dead connection is still
+    caught by the failing command itself on the next call.
+    """
     if self.is_connected and self._imap:
+      if time.monotonic() - self._last_ok < _PROBE_INTERVAL:
+        return True
       try:
         response = await self._imap.noop()
         if response.result == "OK":
+          self._last_ok = time.monotonic()
           return True
       except Exception:
         pass
@@ -97,6 +126,7 @@ class ImapClient:
       self._imap = None
       self.is_connected = False
       self._current_folder = None
+      self._folder_info = None
 
   async def noop(self) -> bool:
     """Send NOOP keepalive."""
@@ -109,12 +139,21 @@ class ImapClient:
       self.is_connected = False
       return False
 
-  async def select_folder(self, folder: str = "INBOX") -> dict[str, Any] | None:
-    """Select a folder, caching to avoid redundant SELECT calls."""
+  async def select_folder(
+    self, folder: str = "INBOX", refresh: bool = False
+  ) -> dict[str, Any] | None:
+    """Select a folder, caching to avoid redundant SELECT calls.
+
+    When the folder is already selected the cached SELECT response is
+    returned without a round-trip — most callers only need the
+    selection itself. Pass refresh=True to re-EXAMINE for fresh counts.
+    """
     if not await self.ensure_connected():
       return None
 
     if self._current_folder == folder:
+      if not refresh and self._folder_info is not None:
+        return self._folder_info
       # Re-examine to get fresh counts
       response = await self._imap.examine(folder)
     else:
@@ -125,10 +164,22 @@ class ImapClient:
       return None
 
     self._current_folder = folder
-    return _parse_select_response(response.lines)
+    self._last_ok = time.monotonic()
+    self._folder_info = _parse_select_response(response.lines)
+    return self._folder_info
 
   async def list_folders(self) -> list[dict[str, str]]:
-    """List all IMAP folders."""
+    """List all IMAP folders.
+
+    The folder list is effectively static between our own mutations, so
+    it is served from a short TTL cache; create/rename/delete bust it.
+    """
+    now = time.monotonic()
+    if self._folders_cache is not None and now - self._folders_cached_at < _FOLDERS_TTL:
+      # Copy on the way out so a caller mutating the result cannot
+      # poison the cache for the rest of the TTL window.
+      return list(self._folders_cache)
+
     if not await self.ensure_connected():
       return []
 
@@ -143,7 +194,9 @@ class ImapClient:
       parsed = _parse_list_response(line)
       if parsed:
         folders.append(parsed)
-    return folders
+    self._folders_cache = folders
+    self._folders_cached_at = time.monotonic()
+    return list(folders)
 
   async def search_uids_since(self, since_uid: int) -> list[int]:
     """Search for UIDs >= since_uid."""
@@ -279,6 +332,7 @@ class ImapClient:
       return False
     try:
       response = await self._imap.create(folder)
+      self._folders_cache = None
       return response.result == "OK"
     except Exception:
       log.exception("Error creating folder %s", folder)
@@ -290,6 +344,7 @@ class ImapClient:
       return False
     try:
       response = await self._imap.rename(old_name, new_name)
+      self._folders_cache = None
       return response.result == "OK"
     except Exception:
       log.exception("Error renaming folder %s -> %s", old_name, new_name)
@@ -301,6 +356,7 @@ class ImapClient:
       return False
     try:
       response = await self._imap.delete(folder)
+      self._folders_cache = None
       return response.result == "OK"
     except Exception:
       log.exception("Error deleting folder %s", folder)
@@ -260,6 +260,35 @@ async def update_email_flags(
   await db.commit()
 
 
+async def update_email_flags_batch(
+  db: aiosqlite.Connection,
+  account_id: str,
+  folder: str,
+  uids: list[int],
+  **flags: bool,
+) -> None:
+  """Update the same flag columns on many cached emails in one statement."""
+  now = time.time()
+  sets = []
+  params: list[Any] = []
+  for flag_name, flag_val in flags.items():
+    if flag_name in ("is_read", "is_flagged", "is_answered", "is_draft"):
+      sets.append(f"{flag_name} = ?")
+      params.append(int(flag_val))
+  if not sets or not uids:
+    return
+  sets.append("updated_at = ?")
+  params.append(now)
+  params.extend([account_id, folder])
+  placeholders = ", ".join("?" for _ in uids)
+  await db.execute(
+    f"UPDATE emails SET {', '.join(sets)} "
+    f"WHERE account_id = ? AND folder = ? AND uid IN ({placeholders})",
+    params + uids,
+  )
+  await db.commit()
+
+
 async def delete_cached_email(
   db: aiosqlite.Connection,
   account_id: str,
@@ -274,6 +303,23 @@ async def delete_cached_email(
   await db.commit()
 
 
+async def delete_cached_emails_batch(
+  db: aiosqlite.Connection,
+  account_id: str,
+  folder: str,
+  uids: list[int],
+) -> None:
+  """Delete many cached emails in one statement."""
+  if not uids:
+    return
+  placeholders = ", ".join("?" for _ in uids)
+  await db.execute(
+    f"DELETE FROM emails WHERE account_id = ? AND folder = ? AND uid IN ({placeholders})",
+    [account_id, folder, *uids],
+  )
+  await db.commit()
+
+
 async def move_cached_email(
   db: aiosqlite.Connection,
   account_id: str,
@@ -46,7 +46,7 @@ async def sync_folder(
 
   try:
     # Select the folder
-    status = await client.select_folder(folder)
+    status = await client.select_folder(folder, refresh=True)
     if not status:
       return 0
 
@@ -4,6 +4,7 @@ Account info and status tool handlers.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC
 from typing import Any
 
@@ -72,13 +73,11 @@ async def get_unread_count(args: dict[str, Any]) -> ToolResult:
     folders = opt_string_list(args, "folders")
 
     if folders:
-      lines = []
-      total = 0
-      for folder in folders:
-        count = await message_api.get_unread_count(folder)
-        total += count
-        lines.append(f"{folder}: {count} unread")
-      lines.append(f"Total: {total} unread")
+      # Independent per-folder counts; overlap them instead of querying
+      # one folder at a time.
+      counts = await asyncio.gather(*(message_api.get_unread_count(f) for f in folders))
+      lines = [f"{folder}: {count} unread" for folder, count in zip(folders, counts)]
+      lines.append(f"Total: {sum(counts)} unread")
       return ToolResult(content="\n".join(lines))
     else:
       count = await message_api.get_unread_count()
@@ -34,7 +34,7 @@ def create_mcp_server() -> Server:
 
   @server.list_tools()
   async def list_tools() -> list[Tool]:
-    return ALL_TOOLS
+    return list(ALL_TOOLS)
 
   @server.call_tool()
   async def call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextContent]:
@@ -19,7 +19,8 @@ from .send import send_tools
 if TYPE_CHECKING:
   from mcp.types import Tool
 
-ALL_TOOLS: list[Tool] = [
+# Immutable: the combined table never changes after import.
+ALL_TOOLS: tuple[Tool, ...] = (
   *folder_tools,
   *message_tools,
   *send_tools,
@@ -27,4 +28,4 @@ ALL_TOOLS: list[Tool] = [
   *attachment_tools,
   *draft_tools,
   *account_tools,
-]
+)
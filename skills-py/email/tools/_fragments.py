@@ -0,0 +1,21 @@
+"""
+Shared JSON Schema fragments for email tool inputSchemas.
+
+The same property blobs repeat across the domain modules; defining them
+once keeps a single dict per fragment on the heap instead of one per
+tool, and identical sub-schemas stay identity-equal for downstream
+caches. JSON encoders emit tuples as arrays, so the wire form is
+unchanged.
+"""
+
+from __future__ import annotations
+
+FOLDER = {"type": "string", "description": "Folder name", "default": "INBOX"}
+MESSAGE_ID = {"type": "number", "description": "UID of the message"}
+
+# One UID or a list of UIDs — the oneOf branches are shared; only the
+# per-tool description differs.
+UID_ONEOF = (
+  {"type": "number"},
+  {"type": "array", "items": {"type": "number"}},
+)
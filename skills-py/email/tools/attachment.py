@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import FOLDER, MESSAGE_ID
+
 attachment_tools: list[Tool] = [
   Tool(
     name="list_attachments",
@@ -13,8 +15,8 @@ attachment_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "message_id": {"type": "number", "description": "UID of the message"},
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "message_id": MESSAGE_ID,
+        "folder": FOLDER,
       },
       "required": ["message_id"],
     },
@@ -25,12 +27,12 @@ attachment_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "message_id": {"type": "number", "description": "UID of the message"},
+        "message_id": MESSAGE_ID,
         "attachment_index": {
           "type": "number",
           "description": "Index of the attachment (0-based)",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_id", "attachment_index"],
     },
@@ -41,12 +43,12 @@ attachment_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "message_id": {"type": "number", "description": "UID of the message"},
+        "message_id": MESSAGE_ID,
         "attachment_index": {
           "type": "number",
           "description": "Index of the attachment (0-based)",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
         "filename": {"type": "string", "description": "Override filename for saving"},
       },
       "required": ["message_id", "attachment_index"],
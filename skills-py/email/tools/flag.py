@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import FOLDER, UID_ONEOF
+
 flag_tools: list[Tool] = [
   Tool(
     name="mark_read",
@@ -14,13 +16,10 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to mark as read",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_ids"],
     },
@@ -32,13 +31,10 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to mark as unread",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_ids"],
     },
@@ -50,13 +46,10 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to flag",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_ids"],
     },
@@ -68,13 +61,10 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to unflag",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_ids"],
     },
@@ -86,13 +76,10 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to delete",
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_ids"],
     },
@@ -104,10 +91,7 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to move",
         },
         "destination": {"type": "string", "description": "Destination folder name"},
@@ -127,10 +111,7 @@ flag_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_ids": {
-          "oneOf": [
-            {"type": "number"},
-            {"type": "array", "items": {"type": "number"}},
-          ],
+          "oneOf": UID_ONEOF,
           "description": "UID(s) of messages to archive",
         },
         "folder": {
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import FOLDER
+
 message_tools: list[Tool] = [
   Tool(
     name="list_messages",
@@ -13,7 +15,7 @@ message_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
         "limit": {
           "type": "number",
           "description": "Maximum messages to return",
@@ -35,7 +37,7 @@ message_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_id": {"type": "number", "description": "The UID of the message"},
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
         "format": {
           "type": "string",
           "description": "Body format: text, html, or raw",
@@ -78,7 +80,7 @@ message_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
         "limit": {"type": "number", "description": "Maximum messages", "default": 20},
       },
     },
@@ -90,7 +92,7 @@ message_tools: list[Tool] = [
       "type": "object",
       "properties": {
         "message_id": {"type": "number", "description": "UID of any message in the thread"},
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
       "required": ["message_id"],
     },
@@ -101,7 +103,7 @@ message_tools: list[Tool] = [
     inputSchema={
       "type": "object",
       "properties": {
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
       },
     },
   ),
@@ -116,7 +118,7 @@ message_tools: list[Tool] = [
           "description": "Number of hours to look back",
           "default": 24,
         },
-        "folder": {"type": "string", "description": "Folder name", "default": "INBOX"},
+        "folder": FOLDER,
         "limit": {"type": "number", "description": "Maximum messages", "default": 20},
       },
     },
@@ -0,0 +1 @@
+# Example skills — exercised by dev.validate.validator, not shipped to hosts
@@ -0,0 +1 @@
+# Kitchen Sink — example skill touching every part of the skill contract
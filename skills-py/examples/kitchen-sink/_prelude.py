@@ -0,0 +1,44 @@
+"""
+Shared import surface for the kitchen-sink section files.
+
+Every section pulls the same dev.types names; binding them once here
+means each `from ._prelude import *` is a single cached-module namespace
+copy instead of repeated import-machinery walks.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from dev.types.setup_types import (
+  SetupField,
+  SetupFieldError,
+  SetupFieldOption,
+  SetupResult,
+  SetupStep,
+)
+from dev.types.skill_types import (
+  SkillContext,
+  SkillDefinition,
+  SkillHooks,
+  SkillTool,
+  ToolDefinition,
+  ToolResult,
+)
+
+__all__ = [
+  "Any",
+  "SetupField",
+  "SetupFieldError",
+  "SetupFieldOption",
+  "SetupResult",
+  "SetupStep",
+  "SkillContext",
+  "SkillDefinition",
+  "SkillHooks",
+  "SkillTool",
+  "ToolDefinition",
+  "ToolResult",
+  "time",
+]
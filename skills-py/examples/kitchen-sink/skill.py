@@ -0,0 +1,7 @@
+"""
+Kitchen Sink - example skill exercising tools, hooks, setup, and memory.
+"""
+
+from .skill_section import skill
+
+__all__ = ["skill"]
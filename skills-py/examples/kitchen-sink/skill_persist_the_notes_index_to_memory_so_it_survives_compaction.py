@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+
+from ._prelude import *  # noqa: F403
+from .skill_save_a_session_summary_to_memory_for_future_context import (
+  drain_background,
+)
+
+# Bound once; datetime.now(timezone.utc) re-reads the attribute per call.
+_UTC = timezone.utc
+
+"""Section: Persist the notes index to memory so it survives compaction"""
+
+
+# orjson serializes in C; fall back to stdlib json when unavailable.
+try:
+  import orjson
+
+  def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+except ImportError:
+  import json as _json
+
+  _COMPACT = (",", ":")
+
+  def _dumps(obj: Any) -> str:
+    return _json.dumps(obj, separators=_COMPACT)
+
+
+# In-process notes index; the durable copy lives under chunked
+# "kitchen-sink/notes-index:<n>" memory keys plus a ":meta" record.
+# Interned constant prefixes: plain concat skips the f-string formatter
+# and interning keeps downstream dict probes on pointer equality.
+_NOTES_INDEX_PREFIX = sys.intern("kitchen-sink/notes-index:")
+_NOTES_INDEX_META = sys.intern("kitchen-sink/notes-index:meta")
+_notes_index: dict[str, str] = {}
+
+# Cap per-write payload size so a large index is serialized slab by
+# slab instead of as one monolithic dump held in RAM.
+_CHUNK_BYTES = 64 * 1024
+
+
+def _chunk_notes_index(index: dict[str, str]) -> list[tuple[str, str]]:
+  """Split the index into ~64 KB (key, payload) slabs plus a meta record."""
+  chunks: list[dict[str, str]] = []
+  buf: dict[str, str] = {}
+  size = 2
+  for k, v in index.items():
+    entry = len(k) + len(v) + 8
+    if buf and size + entry > _CHUNK_BYTES:
+      chunks.append(buf)
+      buf = {}
+      size = 2
+    buf[k] = v
+    size += entry
+  if buf:
+    chunks.append(buf)
+  out = [(_NOTES_INDEX_PREFIX + str(i), _dumps(c)) for i, c in enumerate(chunks)]
+  out.append((_NOTES_INDEX_META, _dumps({"chunks": len(chunks)})))
+  return out
+
+
+# Last-second timestamp cache: within the same wall-clock second, reuse
+# the formatted string instead of re-running datetime + isoformat.
+_last_ts: list[Any] = [0.0, ""]
+
+
+def _now() -> str:
+  t = time.time()
+  if t - _last_ts[0] < 1.0:
+    return _last_ts[1]
+  s = datetime.fromtimestamp(t, _UTC).isoformat()
+  _last_ts[0] = t
+  _last_ts[1] = s
+  return s
+
+
+# Background write queue: flush hooks enqueue and return immediately;
+# the drain task owns the durable round-trips and retries with backoff.
+_write_queue: asyncio.Queue[tuple[str, str]] | None = None
+_writer_task: asyncio.Task[None] | None = None
+
+
+async def _drain_writes(ctx: SkillContext) -> None:
+  backoff = 1.0
+  while True:
+    key, payload = await _write_queue.get()
+    try:
+      await ctx.memory.write(key, payload)
+      backoff = 1.0
+    except asyncio.CancelledError:
+      raise
+    except Exception:
+      await asyncio.sleep(backoff)
+      backoff = min(backoff * 2, 30.0)
+      _write_queue.put_nowait((key, payload))
+
+
+async def on_load(ctx: SkillContext) -> None:
+  import json
+
+  global _log_enabled, _write_queue, _writer_task
+  _log_enabled = bool(ctx.get_state().get("log_enabled", True))
+  _write_queue = asyncio.Queue()
+  _writer_task = asyncio.create_task(_drain_writes(ctx))
+
+  meta = await ctx.memory.read(_NOTES_INDEX_META)
+  if meta:
+    for i in range(json.loads(meta).get("chunks") or 0):
+      raw = await ctx.memory.read(_NOTES_INDEX_PREFIX + str(i))
+      if raw:
+        _notes_index.update(json.loads(raw))
+  else:
+    # Legacy single-key layout from before chunked persistence.
+    raw = await ctx.memory.read("kitchen-sink/notes-index")
+    if raw:
+      _notes_index.update(json.loads(raw))
+  ctx.log(f"kitchen-sink: loaded {len(_notes_index)} notes")
+
+
+async def on_memory_flush(ctx: SkillContext) -> None:
+  # Non-blocking: the durable write happens on the background drain
+  # task, which retries until it lands.
+  if _notes_index:
+    for key, payload in _chunk_notes_index(_notes_index):
+      _write_queue.put_nowait((key, payload))
+  if _tick_count:
+    ctx.set_state({"tick_count": _tick_count, "last_tick_ns": time.monotonic_ns()})
+
+
+async def on_unload(ctx: SkillContext) -> None:
+  global _writer_task
+  _flush_logs(ctx)
+  if _writer_task is not None:
+    _writer_task.cancel()
+    try:
+      await _writer_task
+    except asyncio.CancelledError:
+      pass
+    _writer_task = None
+  # Drain anything still queued so durability survives shutdown.
+  while _write_queue is not None and not _write_queue.empty():
+    key, payload = _write_queue.get_nowait()
+    await ctx.memory.write(key, payload)
+  await drain_background()
+
+
+# Tick log lines are buffered and shipped as one ctx.log call every
+# _LOG_FLUSH_AT entries (and on unload), cutting host log RPCs. ctx.log
+# is synchronous fire-and-forget, so no lock or flush task is needed on
+# the single-threaded event loop. Messages are %-style (fmt, args)
+# pairs formatted only at flush time, and skipped entirely when the
+# host has disabled skill logging; _log_enabled is cached at on_load.
+_log_buf: list[tuple[str, tuple[Any, ...]]] = []
+_LOG_FLUSH_AT = 20
+_log_enabled = True
+
+
+def _log(ctx: SkillContext, fmt: str, *args: Any) -> None:
+  if not _log_enabled:
+    return
+  _log_buf.append((fmt, args))
+  if len(_log_buf) >= _LOG_FLUSH_AT:
+    _flush_logs(ctx)
+
+
+def _flush_logs(ctx: SkillContext) -> None:
+  if _log_buf:
+    ctx.log("\n".join(fmt % args if args else fmt for fmt, args in _log_buf))
+    _log_buf.clear()
+
+
+# Ticks are counted in-process and written through to state every 10th
+# tick (or on memory flush); one durable write per tick bought nothing.
+_tick_count = 0
+
+
+async def on_tick(ctx: SkillContext) -> None:
+  global _tick_count
+  if _tick_count == 0:
+    _tick_count = ctx.get_state().get("tick_count") or 0
+  _tick_count += 1
+  if _tick_count % 10 == 0:
+    # Integer nanoseconds: no formatter per tick and fewer JSON bytes
+    # when state is serialized; convert to ISO only at display time.
+    ctx.set_state({"tick_count": _tick_count, "last_tick_ns": time.monotonic_ns()})
+  _log(ctx, "kitchen-sink: tick #%d", _tick_count)
+
+
+# Persist the notes index to memory so it survives compaction
+async def _add_note(args: dict[str, Any]) -> ToolResult:
+  """Store a note under a title."""
+  title = args.get("title", "").strip()
+  if not title:
+    return ToolResult(content="A note needs a title.", is_error=True)
+  _notes_index[title] = _now()
+  return ToolResult(content=f"Noted {title!r}.")
+
+
+async def _list_notes(args: dict[str, Any]) -> ToolResult:
+  """List stored note titles."""
+  if not _notes_index:
+    return ToolResult(content="No notes yet.")
+  lines = [f"- {title} ({ts})" for title, ts in sorted(_notes_index.items())]
+  return ToolResult(content="\n".join(lines))
+
+
+TOOLS: list[SkillTool] = [
+  SkillTool(
+    definition=ToolDefinition(
+      name="add_note",
+      description="Store a note title in the kitchen-sink notes index.",
+      parameters={
+        "type": "object",
+        "properties": {
+          "title": {"type": "string", "description": "Note title"},
+        },
+        "required": ["title"],
+      },
+    ),
+    execute=_add_note,
+  ),
+  SkillTool(
+    definition=ToolDefinition(
+      name="list_notes",
+      description="List all stored note titles with timestamps.",
+      parameters={"type": "object", "properties": {}},
+    ),
+    execute=_list_notes,
+  ),
+]
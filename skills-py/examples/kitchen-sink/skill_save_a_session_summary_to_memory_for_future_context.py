@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from ._prelude import *  # noqa: F403
+
+# Bound once; see the notes-index section.
+_UTC = timezone.utc
+
+"""Section: Save a session summary to memory for future context"""
+
+
+# orjson serializes in C; fall back to stdlib json when unavailable.
+try:
+  import orjson
+
+  def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+except ImportError:
+  import json as _json
+  from dataclasses import asdict, is_dataclass
+
+  _COMPACT = (",", ":")
+
+  def _dumps(obj: Any) -> str:
+    if is_dataclass(obj):
+      obj = asdict(obj)
+    return _json.dumps(obj, separators=_COMPACT)
+
+
+# Fixed-shape summary record: slots skip the per-instance dict, and
+# orjson serializes dataclasses natively without an intermediate dict.
+@dataclass(slots=True)
+class _SessionSummary:
+  session_id: str
+  message_count: int
+  started_at: str | None
+  ended_at: str
+
+
+# Last-second timestamp cache; see the notes-index section for rationale.
+_last_ts: list[Any] = [0.0, ""]
+
+
+def _now() -> str:
+  t = time.time()
+  if t - _last_ts[0] < 1.0:
+    return _last_ts[1]
+  s = datetime.fromtimestamp(t, _UTC).isoformat()
+  _last_ts[0] = t
+  _last_ts[1] = s
+  return s
+
+
+# Interned constant prefix: plain ASCII concat beats re-running the
+# f-string formatter per write, and the interned key prefix keeps dict
+# probes on pointer equality.
+_SESSION_SUMMARY_PREFIX = sys.intern("session-summary/")
+
+
+# Fire-and-forget pool for buffered-class writes (session summaries are
+# not critical-sync): hooks return immediately and on_unload drains.
+_bg: set[asyncio.Task[Any]] = set()
+
+
+def _schedule(coro: Any) -> None:
+  t = asyncio.create_task(coro)
+  _bg.add(t)
+  t.add_done_callback(_bg.discard)
+
+
+async def drain_background() -> None:
+  """Await all in-flight background writes; called from on_unload."""
+  if _bg:
+    await asyncio.gather(*_bg, return_exceptions=True)
+
+
+# Write-through cache for per-session message counters: incremented
+# in-process on every message, persisted every 10th message and at
+# session end, cutting session-store round-trips by 10x.
+_counts: dict[str, int] = {}
+
+
+async def on_session_start(ctx: SkillContext, session_id: str) -> None:
+  _counts[session_id] = await ctx.session.get("message_count") or 0
+  await ctx.session.set("started_at", _now())
+
+
+async def on_before_message(ctx: SkillContext, message: str) -> str | None:
+  sid = ctx.session.id
+  count = _counts.get(sid, 0) + 1
+  _counts[sid] = count
+  if count % 10 == 0:
+    await ctx.session.set("message_count", count)
+  return None
+
+
+# Save a session summary to memory for future context
+async def on_session_end(ctx: SkillContext, session_id: str) -> None:
+  message_count = _counts.pop(session_id, 0)
+  await ctx.session.set("message_count", message_count)
+  summary = _SessionSummary(
+    session_id=session_id,
+    message_count=message_count,
+    started_at=await ctx.session.get("started_at"),
+    ended_at=_now(),
+  )
+  # Buffered-class write: fire and forget, drained at unload.
+  _schedule(ctx.memory.write(_SESSION_SUMMARY_PREFIX + session_id, _dumps(summary)))
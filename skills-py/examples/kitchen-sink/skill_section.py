@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import functools
+
+from ._prelude import *  # noqa: F403
+
+from .skill_persist_the_notes_index_to_memory_so_it_survives_compaction import (
+  TOOLS,
+  on_load,
+  on_memory_flush,
+  on_tick,
+  on_unload,
+)
+from .skill_save_a_session_summary_to_memory_for_future_context import (
+  on_before_message,
+  on_session_end,
+  on_session_start,
+)
+from .skill_status_error_show_field_errors_stay_on_current_step import (
+  on_setup_cancel,
+  on_setup_start,
+  on_setup_submit,
+)
+
+"""Section: ---------------------------------------------------------------------------"""
+
+
+# Hooks and definition are singletons: hot-reload loops that re-resolve
+# the skill get the same object graph back instead of re-allocating the
+# hook wiring each time.
+_HOOKS = SkillHooks(
+  on_load=on_load,
+  on_unload=on_unload,
+  on_memory_flush=on_memory_flush,
+  on_tick=on_tick,
+  on_session_start=on_session_start,
+  on_before_message=on_before_message,
+  on_session_end=on_session_end,
+  on_setup_start=on_setup_start,
+  on_setup_submit=on_setup_submit,
+  on_setup_cancel=on_setup_cancel,
+)
+
+
+@functools.cache
+def get_skill() -> SkillDefinition:
+  return SkillDefinition(
+    name="kitchen-sink",
+    description="Example skill exercising tools, hooks, setup, and memory.",
+    version="1.0.0",
+    tools=TOOLS,
+    tick_interval=60000,
+    has_setup=True,
+    hooks=_HOOKS,
+  )
+
+
+skill = get_skill()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+
+from ._prelude import *  # noqa: F403
+from .skill_validation import validate_threshold
+
+"""Section: status=error — show field errors, stay on current step"""
+
+
+_EXPERIENCE_OPTIONS = [
+  ("Beginner", "beginner"),
+  ("Intermediate", "intermediate"),
+  ("Advanced", "advanced"),
+  ("Degen", "degen"),
+]
+
+_PREFERENCE_OPTIONS = [
+  ("DeFi", "defi"),
+  ("NFTs", "nfts"),
+  ("Trading", "trading"),
+  ("Development", "development"),
+  ("Research", "research"),
+  ("Governance", "governance"),
+]
+
+# O(1) membership tables for the submit hot path; the option lists above
+# stay ordered for display.
+_EXPERIENCE_VALUES = frozenset(v for _, v in _EXPERIENCE_OPTIONS)
+_PREFERENCE_VALUES = frozenset(v for _, v in _PREFERENCE_OPTIONS)
+
+
+# Both steps are input-independent, so they are built once at import
+# and the singletons are returned on every setup call.
+_PROFILE_STEP = SetupStep(
+  id="profile",
+  title="Your profile",
+  description="Tell the kitchen sink who it is cooking for.",
+  fields=[
+    SetupField(
+      name="username",
+      type="text",
+      label="Username",
+      required=True,
+      placeholder="satoshi",
+    ),
+    SetupField(
+      name="experience",
+      type="select",
+      label="Experience level",
+      required=True,
+      options=[SetupFieldOption(label=l, value=v) for l, v in _EXPERIENCE_OPTIONS],
+    ),
+    SetupField(
+      name="preferences",
+      type="multiselect",
+      label="Interests",
+      options=[SetupFieldOption(label=l, value=v) for l, v in _PREFERENCE_OPTIONS],
+    ),
+  ],
+)
+
+_NOTIFICATIONS_STEP = SetupStep(
+  id="notifications",
+  title="Notifications",
+  fields=[
+    SetupField(
+      name="notify",
+      type="boolean",
+      label="Send me alerts",
+      default=True,
+    ),
+    SetupField(
+      name="alert_threshold",
+      type="number",
+      label="Alert threshold (%)",
+      description="Between 0 and 100.",
+      default=5,
+    ),
+  ],
+)
+
+
+async def on_setup_start(ctx: SkillContext) -> SetupStep:
+  return _PROFILE_STEP
+
+
+async def on_setup_submit(
+  ctx: SkillContext, step_id: str, values: dict[str, Any]
+) -> SetupResult:
+  if step_id == "profile":
+    return await _handle_profile_step(ctx, values)
+  if step_id == "notifications":
+    return await _handle_notifications_step(ctx, values)
+  return SetupResult(status="error", message=f"Unknown setup step {step_id!r}")
+
+
+async def _check_username_unique(ctx: SkillContext, username: str) -> bool:
+  """True when the username is not already claimed in memory."""
+  import json
+
+  if not username:
+    return True
+  raw = await ctx.memory.read("kitchen-sink/taken-usernames")
+  return not raw or username not in json.loads(raw)
+
+
+async def _check_prefs_valid(preferences: list[str]) -> bool:
+  return all(p in _PREFERENCE_VALUES for p in preferences)
+
+
+# status=error — show field errors, stay on current step
+async def _handle_profile_step(
+  ctx: SkillContext, values: dict[str, Any]
+) -> SetupResult:
+  errors: list[SetupFieldError] = []
+  username = (values.get("username") or "").strip()
+  preferences = values.get("preferences") or []
+  if not username:
+    errors.append(SetupFieldError(field="username", message="Username is required."))
+  experience = values.get("experience")
+  if experience not in _EXPERIENCE_VALUES:
+    errors.append(
+      SetupFieldError(field="experience", message="Pick an experience level.")
+    )
+  # Independent checks overlap their I/O; step latency is the max of
+  # the two, not the sum.
+  uniq_ok, prefs_ok = await asyncio.gather(
+    _check_username_unique(ctx, username),
+    _check_prefs_valid(preferences),
+  )
+  if username and not uniq_ok:
+    errors.append(
+      SetupFieldError(field="username", message="Username is already taken.")
+    )
+  if not prefs_ok:
+    errors.append(
+      SetupFieldError(field="preferences", message="Unknown preference value.")
+    )
+  if errors:
+    return SetupResult(status="error", errors=errors)
+  await ctx.session.set("profile", values)
+  return SetupResult(status="next", next_step=_NOTIFICATIONS_STEP)
+
+
+async def _handle_notifications_step(
+  ctx: SkillContext, values: dict[str, Any]
+) -> SetupResult:
+  err = validate_threshold(values.get("alert_threshold", 5))
+  if err is not None:
+    return err
+  await ctx.session.set("notifications", values)
+  return SetupResult(status="complete", message="Kitchen sink is all set.")
+
+
+async def on_setup_cancel(ctx: SkillContext) -> None:
+  ctx.log("kitchen-sink: setup cancelled")
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import math
+import re
+
+from ._prelude import *  # noqa: F403
+
+"""Section: Validation"""
+
+
+# Strings matching this cannot make float() raise, so the parse path
+# needs no try/except.
+_NUM_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+
+def _threshold_err(msg: str) -> SetupResult:
+  """Single construction site for alert_threshold errors."""
+  return SetupResult(
+    status="error",
+    errors=[SetupFieldError(field="alert_threshold", message=msg)],
+  )
+
+
+# Validation helpers for the notifications step.
+def validate_threshold(value: Any) -> SetupResult | None:
+  """Check alert_threshold is a number in [0, 100]; None means valid."""
+  if isinstance(value, (int, float)):
+    if math.isfinite(value) and 0.0 <= value <= 100.0:
+      return None
+    return _threshold_err("Threshold must be between 0 and 100.")
+  if isinstance(value, str) and _NUM_RE.match(value):
+    if 0.0 <= float(value) <= 100.0:
+      return None
+    return _threshold_err("Threshold must be between 0 and 100.")
+  return _threshold_err("Must be a valid number.")
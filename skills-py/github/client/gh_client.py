@@ -92,6 +92,17 @@ async def run_sync(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
   return await _run_sync(fn, *args, **kwargs)
 
 
+async def gather_sync(*calls: Callable[[], Any]) -> list[Any]:
+  """
+  Run independent synchronous PyGithub calls concurrently.
+
+  Each call runs on its own thread and the requests overlap on the
+  keep-alive connection pool, so N independent round-trips finish in
+  roughly max(RTT) instead of sum(RTT).
+  """
+  return await asyncio.gather(*(asyncio.to_thread(call) for call in calls))
+
+
 # ---------------------------------------------------------------------------
 # Singleton
 # ---------------------------------------------------------------------------
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
 from ..helpers import ToolResult
@@ -19,10 +21,60 @@ for mod in (repo, issue, pr, search, code, release, gist, actions, notification,
       DISPATCH[name] = fn
 
 
+# Generated single-function router: each handler is bound to a local
+# _h_<name> global and selected by an if-chain of string compares, so a
+# dispatch is one call frame with no dict probe or attribute fetch on
+# the hot path. Names that are not identifiers fall back to DISPATCH.
+def _build_fast_dispatch() -> Any:
+  namespace: dict[str, Any] = {}
+  lines = ["def _fast_dispatch(name, args):"]
+  for tool_name, fn in DISPATCH.items():
+    if not tool_name.isidentifier():
+      continue
+    namespace[f"_h_{tool_name}"] = fn
+    lines.append(f"  if name == {tool_name!r}: return _h_{tool_name}(args)")
+  lines.append("  return None")
+  exec("\n".join(lines), namespace)  # noqa: S102
+  return namespace["_fast_dispatch"]
+
+
+_fast_dispatch = _build_fast_dispatch()
+
+
+# Client-side token buckets mirroring GitHub's server limits (5000/hr
+# core, 30/min search). Smoothing bursts locally costs a short sleep
+# instead of a 403 + Retry-After round-trip once the server limit trips.
+_BUCKETS: dict[str, list[float]] = {
+  # bucket -> [tokens, capacity, refill_per_sec, last_refill]
+  "core": [5000.0, 5000.0, 5000.0 / 3600.0, 0.0],
+  "search": [30.0, 30.0, 30.0 / 60.0, 0.0],
+}
+
+
+async def _take_token(bucket_name: str) -> None:
+  """Refill and take one token, sleeping until one is available."""
+  bucket = _BUCKETS[bucket_name]
+  while True:
+    now = time.monotonic()
+    tokens, capacity, rate, last = bucket
+    tokens = min(capacity, tokens + (now - last) * rate)
+    if tokens >= 1.0:
+      bucket[0] = tokens - 1.0
+      bucket[3] = now
+      return
+    bucket[0] = tokens
+    bucket[3] = now
+    await asyncio.sleep((1.0 - tokens) / rate)
+
+
 async def dispatch_tool(name: str, arguments: dict[str, Any]) -> ToolResult:
   """Look up and execute a tool handler by name."""
-  handler = DISPATCH.get(name)
-  if handler is None:
-    return ToolResult(content=f"Unknown tool: {name}", is_error=True)
-  result: ToolResult = await handler(arguments)
+  await _take_token("search" if name.startswith("search_") else "core")
+  coro = _fast_dispatch(name, arguments)
+  if coro is None:
+    handler = DISPATCH.get(name)
+    if handler is None:
+      return ToolResult(content=f"Unknown tool: {name}", is_error=True)
+    coro = handler(arguments)
+  result: ToolResult = await coro
   return result
@@ -3,11 +3,89 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 from typing import Any
 
+from github import GithubException
+
 from ..client.gh_client import get_client, run_sync
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error, truncate
-from ..validation import opt_string, req_string
+from ..validation import opt_string, opt_string_list, req_string
+
+# orjson parses and encodes several times faster than stdlib json; this
+# module handles whole raw API payloads, so it is the one place in the
+# server where (de)serialization is on the hot path. Fall back when
+# unavailable.
+try:
+  import orjson
+
+  _loads = orjson.loads
+
+  def _dumps_pretty(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+  _loads = json.loads
+
+  def _dumps_pretty(obj: Any) -> str:
+    return json.dumps(obj, indent=2)
+
+# GraphQL sub-queries addressable from batch_repo_read. Each costs one
+# aliased field in a single document, so N resources are one HTTP
+# round-trip and one primary-rate-limit point instead of N REST calls.
+_SUBQUERIES = {
+  "info": (
+    "description stargazerCount forkCount isArchived "
+    "defaultBranchRef { name }"
+  ),
+  "readme": 'readme: object(expression: "HEAD:README.md") { ... on Blob { text } }',
+  "releases": (
+    "releases(first: 10, orderBy: {field: CREATED_AT, direction: DESC}) "
+    "{ nodes { tagName name publishedAt } }"
+  ),
+  "branches": 'branches: refs(refPrefix: "refs/heads/", first: 50) { nodes { name } }',
+}
+
+
+# ETag cache for raw GET endpoints, LRU-capped. A 304 revalidation
+# carries no body, skips JSON parsing, and does not count against the
+# primary rate limit, so repeated reads of unchanged resources are
+# nearly free.
+_ETAG_CACHE: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+_ETAG_CACHE_MAX = 128
+
+
+async def _cached_get(endpoint: str, headers: dict[str, str]) -> Any:
+  """GET with If-None-Match revalidation against the ETag cache."""
+  cached = _ETAG_CACHE.get(endpoint)
+  if cached is not None:
+    headers = {**headers, "If-None-Match": cached[0]}
+  requester = get_client().gh._Github__requester
+  status, resp_headers, raw = await run_sync(
+    requester.requestJson, "GET", endpoint, headers=headers
+  )
+  if status == 304 and cached is not None:
+    _ETAG_CACHE.move_to_end(endpoint)
+    return cached[1]
+  data = _loads(raw) if raw else None
+  if status >= 400:
+    raise GithubException(status, data, resp_headers)
+  etag = (resp_headers or {}).get("etag")
+  if etag:
+    _ETAG_CACHE[endpoint] = (etag, data)
+    _ETAG_CACHE.move_to_end(endpoint)
+    while len(_ETAG_CACHE) > _ETAG_CACHE_MAX:
+      _ETAG_CACHE.popitem(last=False)
+  return data
+
+
+async def _graphql(query: str) -> Any:
+  """POST one GraphQL document through the authenticated requester."""
+  requester = get_client().gh._Github__requester
+  _headers, data = await run_sync(
+    requester.requestJsonAndCheck, "POST", "/graphql", input={"query": query}
+  )
+  return data
 
 
 async def gh_api(args: dict[str, Any]) -> ToolResult:
@@ -32,9 +110,7 @@ async def gh_api(args: dict[str, Any]) -> ToolResult:
       headers["Content-Type"] = "application/json"
 
     if method == "GET":
-      _response_headers, data = await run_sync(
-        requester.requestJsonAndCheck, "GET", endpoint, headers=headers
-      )
+      data = await _cached_get(endpoint, headers)
     elif method == "POST":
       _response_headers, data = await run_sync(
         requester.requestJsonAndCheck, "POST", endpoint, headers=headers, input=input_data
@@ -56,6 +132,37 @@ async def gh_api(args: dict[str, Any]) -> ToolResult:
 
     if data is None:
       return ToolResult(content="(no content)")
-    return ToolResult(content=truncate(json.dumps(data, indent=2)))
+    return ToolResult(content=truncate(_dumps_pretty(data)))
   except Exception as e:
     return log_and_format_error("gh_api", e, ErrorCategory.API)
+
+
+async def batch_repo_read(args: dict[str, Any]) -> ToolResult:
+  """Fetch several repository resources in one GraphQL round-trip."""
+  try:
+    owner = req_string(args, "owner")
+    repo = req_string(args, "repo")
+    requested = opt_string_list(args, "requests")
+    if not requested:
+      return ToolResult(
+        content="'requests' must list at least one resource to fetch.",
+        is_error=True,
+      )
+
+    unknown = [r for r in requested if r not in _SUBQUERIES]
+    if unknown:
+      return ToolResult(
+        content=f"Unknown resources: {', '.join(map(str, unknown))}. "
+        f"Supported: {', '.join(_SUBQUERIES)}",
+        is_error=True,
+      )
+
+    fields = " ".join(_SUBQUERIES[r] for r in dict.fromkeys(requested))
+    query = (
+      f"query {{ repository(owner: {json.dumps(owner)}, "
+      f"name: {json.dumps(repo)}) {{ {fields} }} }}"
+    )
+    data = await _graphql(query)
+    return ToolResult(content=truncate(_dumps_pretty(data)))
+  except Exception as e:
+    return log_and_format_error("batch_repo_read", e, ErrorCategory.API)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
-from ..client.gh_client import get_client, run_sync
+from ..client.gh_client import gather_sync, get_client, run_sync
 from ..helpers import ErrorCategory, ToolResult, log_and_format_error, truncate
 from ..validation import (
   opt_number,
@@ -230,8 +231,9 @@ async def add_issue_labels(args: dict[str, Any]) -> ToolResult:
     gh = get_client().gh
     repo = await run_sync(gh.get_repo, spec)
     issue = await run_sync(repo.get_issue, number)
-    for label in labels:
-      await run_sync(issue.add_to_labels, label)
+    # Independent per-label requests; overlap them instead of paying
+    # one full round-trip each.
+    await gather_sync(*(functools.partial(issue.add_to_labels, label) for label in labels))
     return ToolResult(content=f"Labels added to issue #{number}: {', '.join(labels)}")
   except Exception as e:
     return log_and_format_error("add_issue_labels", e, ErrorCategory.ISSUE)
@@ -248,8 +250,9 @@ async def remove_issue_labels(args: dict[str, Any]) -> ToolResult:
     gh = get_client().gh
     repo = await run_sync(gh.get_repo, spec)
     issue = await run_sync(repo.get_issue, number)
-    for label in labels:
-      await run_sync(issue.remove_from_labels, label)
+    await gather_sync(
+      *(functools.partial(issue.remove_from_labels, label) for label in labels)
+    )
     return ToolResult(content=f"Labels removed from issue #{number}: {', '.join(labels)}")
   except Exception as e:
     return log_and_format_error("remove_issue_labels", e, ErrorCategory.ISSUE)
@@ -266,9 +269,8 @@ async def add_issue_assignees(args: dict[str, Any]) -> ToolResult:
     gh = get_client().gh
     repo = await run_sync(gh.get_repo, spec)
     issue = await run_sync(repo.get_issue, number)
-    for assignee in assignees:
-      user = await run_sync(gh.get_user, assignee)
-      await run_sync(issue.add_to_assignees, user)
+    users = await gather_sync(*(functools.partial(gh.get_user, a) for a in assignees))
+    await gather_sync(*(functools.partial(issue.add_to_assignees, u) for u in users))
     return ToolResult(content=f"Assignees added to issue #{number}: {', '.join(assignees)}")
   except Exception as e:
     return log_and_format_error("add_issue_assignees", e, ErrorCategory.ISSUE)
@@ -285,9 +287,8 @@ async def remove_issue_assignees(args: dict[str, Any]) -> ToolResult:
     gh = get_client().gh
     repo = await run_sync(gh.get_repo, spec)
     issue = await run_sync(repo.get_issue, number)
-    for assignee in assignees:
-      user = await run_sync(gh.get_user, assignee)
-      await run_sync(issue.remove_from_assignees, user)
+    users = await gather_sync(*(functools.partial(gh.get_user, a) for a in assignees))
+    await gather_sync(*(functools.partial(issue.remove_from_assignees, u) for u in users))
     return ToolResult(content=f"Assignees removed from issue #{number}: {', '.join(assignees)}")
   except Exception as e:
     return log_and_format_error("remove_issue_assignees", e, ErrorCategory.ISSUE)
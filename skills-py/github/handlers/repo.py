@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any
 
 from ..client.gh_client import get_client, run_sync
@@ -255,7 +256,7 @@ async def list_languages(args: dict[str, Any]) -> ToolResult:
       return ToolResult(content=f"No languages detected in {spec}.")
     total = sum(languages.values())
     lines = []
-    for lang, bytes_count in sorted(languages.items(), key=lambda x: x[1], reverse=True):
+    for lang, bytes_count in sorted(languages.items(), key=itemgetter(1), reverse=True):
       pct = (bytes_count / total * 100) if total else 0
       lines.append(f"{lang}: {pct:.1f}%")
     return ToolResult(content="\n".join(lines))
@@ -17,7 +17,7 @@ log = logging.getLogger("skill.github.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
@@ -16,7 +16,7 @@ from mcp.types import TextContent, Tool
 
 from .client.gh_client import create_client, get_client
 from .handlers import dispatch_tool
-from .tools import ALL_TOOLS
+from .tools import ALL_TOOLS, validate_args
 
 log = logging.getLogger("skill.github.server")
 
@@ -27,11 +27,14 @@ def create_mcp_server() -> Server:
 
   @server.list_tools()
   async def list_tools() -> list[Tool]:
-    return ALL_TOOLS
+    return list(ALL_TOOLS)
 
   @server.call_tool()
   async def call_tool(name: str, arguments: dict[str, Any] | None) -> list[TextContent]:
-    args = arguments or {}
+    try:
+      args = validate_args(name, arguments or {})
+    except Exception as e:
+      return [TextContent(type="text", text=f"Invalid arguments for {name}: {e}")]
     result = await dispatch_tool(name, args)
     return [TextContent(type="text", text=result.content)]
 
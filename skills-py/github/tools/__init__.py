@@ -1,36 +1,266 @@
 """
 GitHub tool definitions organized by domain.
 
-Each module exports a list of Tool objects that are combined into ALL_TOOLS.
+Each module exports a list of Tool objects. Repo tools load eagerly;
+the extended groups (and the combined tables built from them) are
+materialized on first attribute access via PEP 562, so callers that
+only touch core tools skip most of the import-time construction.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+import json
+import re
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable
 
-from .actions import actions_tools
-from .api import api_tools
-from .code import code_tools
-from .gist import gist_tools
-from .issue import issue_tools
-from .notification import notification_tools
-from .pr import pr_tools
-from .release import release_tools
 from .repo import repo_tools
-from .search import search_tools
 
 if TYPE_CHECKING:
   from mcp.types import Tool
 
-ALL_TOOLS: list[Tool] = [
-  *repo_tools,
-  *issue_tools,
-  *pr_tools,
-  *search_tools,
-  *code_tools,
-  *release_tools,
-  *gist_tools,
-  *actions_tools,
-  *notification_tools,
-  *api_tools,
-]
+# Lazily imported attribute -> submodule. Each resolves once and is
+# memoized into globals(), so later accesses bypass __getattr__.
+_LAZY_GROUPS = {
+  "issue_tools": "issue",
+  "pr_tools": "pr",
+  "search_tools": "search",
+  "code_tools": "code",
+  "release_tools": "release",
+  "gist_tools": "gist",
+  "actions_tools": "actions",
+  "notification_tools": "notification",
+  "api_tools": "api",
+}
+
+_GROUP_ORDER = (
+  "repo_tools",
+  "issue_tools",
+  "pr_tools",
+  "search_tools",
+  "code_tools",
+  "release_tools",
+  "gist_tools",
+  "actions_tools",
+  "notification_tools",
+  "api_tools",
+)
+
+
+def __getattr__(name: str) -> Any:
+  if name in _LAZY_GROUPS:
+    module = importlib.import_module(f".{_LAZY_GROUPS[name]}", __name__)
+    value: Any = getattr(module, name)
+  elif name == "ALL_TOOLS":
+    # Immutable: the table never changes once built, and forcing it
+    # pulls in every group. chain.from_iterable concatenates the group
+    # lists in C without the generator-frame churn of a nested
+    # comprehension.
+    value = tuple(chain.from_iterable(map(_group, _GROUP_ORDER)))
+  elif name == "TOOLS_BY_NAME":
+    # Read-only name index: dispatch is one hash probe, not a scan.
+    value = MappingProxyType({t.name: t for t in _all_tools()})
+  elif name == "TOOL_STUBS":
+    # Lean (name, inputSchema) pairs for hosts that dispatch without
+    # descriptions; the bytes-heavy text stays behind describe().
+    value = tuple((t.name, t.inputSchema) for t in _all_tools())
+  elif name in ("TOOL_NAMES", "TOOL_SCHEMAS", "NAME_INDEX"):
+    # Column-wise views of the tool table: the hot dispatch path only
+    # touches names and schemas, and two dict/tuple hops beat chasing
+    # attributes through 72 scattered Tool objects.
+    tools = _all_tools()
+    names = tuple(t.name for t in tools)
+    globals()["TOOL_NAMES"] = names
+    globals()["TOOL_SCHEMAS"] = tuple(t.inputSchema for t in tools)
+    globals()["NAME_INDEX"] = {n: i for i, n in enumerate(names)}
+    return globals()[name]
+  else:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  globals()[name] = value
+  return value
+
+
+def _group(name: str) -> list[Tool]:
+  """Resolve one tool group, honoring the memoized globals."""
+  if name == "repo_tools":
+    return repo_tools
+  value = globals().get(name)
+  if value is None:
+    value = __getattr__(name)
+  return value
+
+
+def _all_tools() -> tuple[Tool, ...]:
+  """Resolve ALL_TOOLS for module-internal use (PEP 562 does not
+  cover a module's own global lookups)."""
+  value = globals().get("ALL_TOOLS")
+  if value is None:
+    value = __getattr__("ALL_TOOLS")
+  return value
+
+
+# orjson encodes straight to bytes several times faster than stdlib
+# json; fall back when unavailable.
+try:
+  import orjson
+
+  _dumps = orjson.dumps
+except ImportError:
+
+  def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Pre-serialized inputSchema bytes per tool, built once on first use:
+# consumers that put schemas on the wire can splice these in instead of
+# re-encoding the nested dicts on every tools/list response.
+_schema_json: dict[str, bytes] | None = None
+
+
+def schema_json(name: str) -> bytes | None:
+  """Cached JSON-encoded inputSchema for a tool, or None if unknown."""
+  global _schema_json
+  if _schema_json is None:
+    _schema_json = {t.name: _dumps(t.inputSchema) for t in _all_tools()}
+  return _schema_json.get(name)
+
+
+# Compiled argument validators, one per tool name, built on first use.
+# fastjsonschema compiles each schema to a plain function once, so a
+# tool call validates with a single call instead of re-walking the
+# schema; None means not built yet, {} means unavailable.
+_validators: dict[str, Callable[[dict[str, Any]], Any]] | None = None
+
+
+def _build_validators() -> dict[str, Callable[[dict[str, Any]], Any]]:
+  try:
+    import fastjsonschema
+  except ImportError:
+    return {}
+  validators: dict[str, Callable[[dict[str, Any]], Any]] = {}
+  # Many tools share identical schemas; key compilation on the
+  # canonical JSON form so those share one compiled function.
+  compiled: dict[str, Callable[[dict[str, Any]], Any]] = {}
+  for t in _all_tools():
+    key = json.dumps(t.inputSchema, sort_keys=True)
+    fn = compiled.get(key)
+    if fn is None:
+      fn = compiled[key] = fastjsonschema.compile(t.inputSchema)
+    validators[t.name] = fn
+  return validators
+
+
+def validate_args(name: str, args: dict[str, Any]) -> dict[str, Any]:
+  """
+  Validate tool-call arguments against the tool's compiled schema.
+
+  Returns the (possibly default-filled) arguments. Unknown tools and
+  missing fastjsonschema pass args through untouched; handlers still
+  do their own required-field checks.
+  """
+  global _validators
+  if _validators is None:
+    _validators = _build_validators()
+  fn = _validators.get(name)
+  if fn is None:
+    return args
+  return fn(args)
+
+
+# One compiled alternation with a named group per domain: category
+# routing is a single anchored match instead of per-category
+# membership checks, regardless of how many tools are registered.
+_category_re: re.Pattern[str] | None = None
+
+
+def tool_category(name: str) -> str | None:
+  """Map a tool name to its domain group (e.g. "repo"), or None."""
+  global _category_re
+  if _category_re is None:
+    parts = []
+    for group in _GROUP_ORDER:
+      names = "|".join(re.escape(t.name) for t in _group(group))
+      parts.append(f"(?P<{group.removesuffix('_tools')}>{names})")
+    _category_re = re.compile("^(?:" + "|".join(parts) + ")$")
+  m = _category_re.match(name)
+  return m.lastgroup if m else None
+
+
+def get_tool(name: str) -> Tool | None:
+  """Resolve a tool by name with one hash probe."""
+  index = globals().get("TOOLS_BY_NAME")
+  if index is None:
+    index = __getattr__("TOOLS_BY_NAME")
+  return index.get(name)
+
+
+def describe(name: str) -> str:
+  """Full description for a tool, fetched on demand rather than
+  shipped with every stub listing."""
+  tool = get_tool(name)
+  return tool.description if tool is not None else ""
+
+
+def _freeze(value: Any) -> Any:
+  """Recursively wrap dicts in MappingProxyType and lists in tuples."""
+  if isinstance(value, dict):
+    return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+  if isinstance(value, (list, tuple)):
+    return tuple(_freeze(v) for v in value)
+  return value
+
+
+# Read-only view of every inputSchema, frozen recursively. The proxies
+# are built once and never replaced, so downstream caches can key on
+# id(schema) instead of content-hashing the dict per call. The Tool
+# objects keep their plain dicts for wire serialization.
+_frozen_schemas: MappingProxyType[str, Any] | None = None
+
+
+def frozen_schemas() -> MappingProxyType[str, Any]:
+  """Immutable name -> frozen-inputSchema mapping, built on first use."""
+  global _frozen_schemas
+  if _frozen_schemas is None:
+    _frozen_schemas = MappingProxyType(
+      {t.name: _freeze(t.inputSchema) for t in _all_tools()}
+    )
+  return _frozen_schemas
+
+
+# One compiled oneOf schema covering every tool-call payload: a single
+# validator call checks name and arguments together, with the name
+# const acting as the discriminator. None = unbuilt, False = no
+# fastjsonschema.
+_bundle: Any = None
+
+
+def validate_tool_call(payload: dict[str, Any]) -> dict[str, Any]:
+  """Validate a {"name": ..., "arguments": ...} payload in one call."""
+  global _bundle
+  if _bundle is None:
+    try:
+      import fastjsonschema
+    except ImportError:
+      _bundle = False
+    else:
+      _bundle = fastjsonschema.compile(
+        {
+          "oneOf": [
+            {
+              "type": "object",
+              "properties": {
+                "name": {"const": t.name},
+                "arguments": t.inputSchema,
+              },
+              "required": ["name", "arguments"],
+            }
+            for t in _all_tools()
+          ]
+        }
+      )
+  if _bundle is False:
+    validate_args(str(payload.get("name", "")), payload.get("arguments") or {})
+    return payload
+  return _bundle(payload)
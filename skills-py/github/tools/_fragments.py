@@ -0,0 +1,54 @@
+"""
+Shared JSON Schema fragments for tool inputSchemas.
+
+The same property blobs repeat across dozens of tools; building them
+once and referencing them keeps one dict per fragment on the heap
+instead of one per tool, and identical sub-schemas stay identity-equal
+for downstream caches.
+"""
+
+from __future__ import annotations
+
+import sys
+
+# Descriptions pass through sys.intern so tool modules that repeat the
+# same phrasing inline collapse onto one string object: duplicates cost
+# no extra memory, and dict/equality checks on them short-circuit on
+# identity during validator compilation.
+_i = sys.intern
+
+OWNER = {"type": "string", "description": _i("Repository owner")}
+REPO = {"type": "string", "description": _i("Repository name")}
+# Numeric identifiers carry a lower bound so the compiled validators
+# reject garbage locally instead of after a failed API round-trip.
+ISSUE_NUMBER = {"type": "number", "minimum": 1, "description": _i("Issue number")}
+PR_NUMBER = {"type": "number", "minimum": 1, "description": _i("Pull request number")}
+RUN_ID = {"type": "number", "minimum": 1, "description": _i("Workflow run ID")}
+
+GIST_ID = {"type": "string", "description": _i("The gist ID")}
+LABEL_FILTER = {"type": "string", "description": _i("Filter by label name")}
+COMMENT_BODY = {
+  "type": "string",
+  "description": _i("Comment body (Markdown supported)"),
+}
+LIMIT_30 = {
+  "type": "number",
+  "minimum": 1,
+  "maximum": 100,
+  "description": _i("Maximum number of results to return"),
+  "default": 30,
+}
+
+# Enum value sets as tuples: constant-folded by CPython and shared
+# wherever the same value set recurs. JSON encoders emit tuples as
+# arrays, so the wire form is unchanged.
+STATE_ENUM = ("open", "closed", "all")
+
+# The common "required" field lists, shared by reference for the same
+# reason. Anything rarer than these stays an inline literal.
+REQ_OWNER_REPO = ("owner", "repo")
+REQ_OWNER_REPO_NUMBER = ("owner", "repo", "number")
+REQ_OWNER_REPO_RUN_ID = ("owner", "repo", "run_id")
+REQ_OWNER_REPO_TAG = ("owner", "repo", "tag")
+REQ_QUERY = ("query",)
+REQ_GIST_ID = ("gist_id",)
@@ -0,0 +1,62 @@
+"""
+Compact spec -> Tool generator.
+
+A spec row is (name, description, fields) where fields is a
+comma-separated list of property tokens: a trailing "?" marks the
+property optional, and "prop=key" names the property `prop` while
+pulling its fragment from registry entry `key`. The generator shares
+one property dict per token across every generated schema, so the
+table is both shorter source and structurally deduplicated.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mcp.types import Tool
+
+from ._fragments import ISSUE_NUMBER, OWNER, PR_NUMBER, REPO, RUN_ID
+
+# Generated definitions inherit the model_construct fast path used by
+# the hand-written modules.
+_tool = Tool.model_construct
+
+# Property fragments addressable from any spec; modules extend this
+# with their own via the extra_props argument.
+REGISTRY: dict[str, dict[str, Any]] = {
+  "owner": OWNER,
+  "repo": REPO,
+  "number": ISSUE_NUMBER,
+  "pr_number": PR_NUMBER,
+  "run_id": RUN_ID,
+}
+
+
+def tools_from_spec(
+  spec: tuple[tuple[str, str, str], ...],
+  extra_props: dict[str, dict[str, Any]] | None = None,
+) -> list[Tool]:
+  """Expand spec rows into Tool objects once at import."""
+  registry = {**REGISTRY, **extra_props} if extra_props else REGISTRY
+  tools: list[Tool] = []
+  for name, description, fields in spec:
+    props: dict[str, Any] = {}
+    required: list[str] = []
+    for token in fields.split(","):
+      token = token.strip()
+      if not token:
+        continue
+      if token.endswith("?"):
+        token = token[:-1]
+        optional = True
+      else:
+        optional = False
+      prop_name, _, key = token.partition("=")
+      props[prop_name] = registry[key or prop_name]
+      if not optional:
+        required.append(prop_name)
+    schema: dict[str, Any] = {"type": "object", "properties": props}
+    if required:
+      schema["required"] = required
+    tools.append(_tool(name=name, description=description, inputSchema=schema))
+  return tools
@@ -6,27 +6,33 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import OWNER, REPO, REQ_OWNER_REPO, REQ_OWNER_REPO_RUN_ID, RUN_ID
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 actions_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="list_workflows",
     description="List GitHub Actions workflows defined in a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="list_workflow_runs",
     description="List recent workflow runs for a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "limit": {
           "type": "number",
           "description": "Maximum number of runs to return",
@@ -40,85 +46,85 @@ actions_tools: list[Tool] = [
         "status": {
           "type": "string",
           "description": "Filter by status",
-          "enum": ["queued", "in_progress", "completed", "waiting", "requested"],
+          "enum": ("queued", "in_progress", "completed", "waiting", "requested"),
         },
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="get_workflow_run",
     description="Get detailed information about a specific workflow run",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "run_id": {"type": "number", "description": "Workflow run ID"},
+        "owner": OWNER,
+        "repo": REPO,
+        "run_id": RUN_ID,
       },
-      "required": ["owner", "repo", "run_id"],
+      "required": REQ_OWNER_REPO_RUN_ID,
     },
   ),
-  Tool(
+  _tool(
     name="list_run_jobs",
     description="List jobs for a specific workflow run",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "run_id": {"type": "number", "description": "Workflow run ID"},
+        "owner": OWNER,
+        "repo": REPO,
+        "run_id": RUN_ID,
       },
-      "required": ["owner", "repo", "run_id"],
+      "required": REQ_OWNER_REPO_RUN_ID,
     },
   ),
-  Tool(
+  _tool(
     name="get_run_logs",
     description="Download logs for a specific workflow run",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "run_id": {"type": "number", "description": "Workflow run ID"},
+        "owner": OWNER,
+        "repo": REPO,
+        "run_id": RUN_ID,
       },
-      "required": ["owner", "repo", "run_id"],
+      "required": REQ_OWNER_REPO_RUN_ID,
     },
   ),
-  Tool(
+  _tool(
     name="rerun_workflow",
     description="Re-run an entire workflow run",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "run_id": {"type": "number", "description": "Workflow run ID to re-run"},
       },
-      "required": ["owner", "repo", "run_id"],
+      "required": REQ_OWNER_REPO_RUN_ID,
     },
   ),
-  Tool(
+  _tool(
     name="cancel_workflow_run",
     description="Cancel a workflow run that is in progress",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "run_id": {"type": "number", "description": "Workflow run ID to cancel"},
       },
-      "required": ["owner", "repo", "run_id"],
+      "required": REQ_OWNER_REPO_RUN_ID,
     },
   ),
-  Tool(
+  _tool(
     name="trigger_workflow",
     description="Manually trigger a workflow dispatch event",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "workflow_id": {
           "type": "string",
           "description": "Workflow ID or filename (e.g. 'deploy.yml')",
@@ -137,14 +143,14 @@ actions_tools: list[Tool] = [
       "required": ["owner", "repo", "workflow_id"],
     },
   ),
-  Tool(
+  _tool(
     name="view_workflow_yaml",
     description="View the YAML source of a workflow definition",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "workflow_id": {
           "type": "string",
           "description": "Workflow ID or filename (e.g. 'ci.yml')",
@@ -1,13 +1,19 @@
 """
-Fallback / raw API tool (1 tool).
+Fallback / raw API tools (2 tools).
 """
 
 from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import OWNER, REPO
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 api_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="gh_api",
     description="Make a raw GitHub REST API request. Use this for any endpoint not covered by the other tools",
     inputSchema={
@@ -20,7 +26,7 @@ api_tools: list[Tool] = [
         "method": {
           "type": "string",
           "description": "HTTP method",
-          "enum": ["GET", "POST", "PUT", "PATCH", "DELETE"],
+          "enum": ("GET", "POST", "PUT", "PATCH", "DELETE"),
           "default": "GET",
         },
         "body": {
@@ -32,4 +38,24 @@ api_tools: list[Tool] = [
       "required": ["endpoint"],
     },
   ),
+  _tool(
+    name="batch_repo_read",
+    description="Read several repository resources (info, readme, releases, branches) in a single GraphQL request instead of one REST call each",
+    inputSchema={
+      "type": "object",
+      "properties": {
+        "owner": OWNER,
+        "repo": REPO,
+        "requests": {
+          "type": "array",
+          "items": {
+            "type": "string",
+            "enum": ("info", "readme", "releases", "branches"),
+          },
+          "description": "Resources to fetch in one round-trip",
+        },
+      },
+      "required": ["owner", "repo", "requests"],
+    },
+  ),
 ]
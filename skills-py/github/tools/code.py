@@ -4,56 +4,36 @@ Code / File tools (3 tools).
 
 from __future__ import annotations
 
-from mcp.types import Tool
+from ._spec import tools_from_spec
 
-code_tools: list[Tool] = [
-  Tool(
-    name="view_file",
-    description="View the contents of a file in a repository",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "path": {"type": "string", "description": "File path within the repository"},
-        "ref": {
-          "type": "string",
-          "description": "Git ref (branch, tag, or commit SHA). Defaults to the default branch",
-        },
-      },
-      "required": ["owner", "repo", "path"],
-    },
+_PATH = {"type": "string", "description": "File path within the repository"}
+_DIR_PATH = {
+  "type": "string",
+  "description": "Directory path within the repository. Defaults to the root",
+}
+_REF = {
+  "type": "string",
+  "description": "Git ref (branch, tag, or commit SHA). Defaults to the default branch",
+}
+
+_SPEC = (
+  (
+    "view_file",
+    "View the contents of a file in a repository",
+    "owner,repo,path,ref?",
   ),
-  Tool(
-    name="list_directory",
-    description="List the contents of a directory in a repository",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "path": {
-          "type": "string",
-          "description": "Directory path within the repository. Defaults to the root",
-        },
-        "ref": {
-          "type": "string",
-          "description": "Git ref (branch, tag, or commit SHA). Defaults to the default branch",
-        },
-      },
-      "required": ["owner", "repo"],
-    },
+  (
+    "list_directory",
+    "List the contents of a directory in a repository",
+    "owner,repo,path=dir_path?,ref?",
   ),
-  Tool(
-    name="get_readme",
-    description="Get the README file for a repository",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-      },
-      "required": ["owner", "repo"],
-    },
+  (
+    "get_readme",
+    "Get the README file for a repository",
+    "owner,repo",
   ),
-]
+)
+
+code_tools = tools_from_spec(
+  _SPEC, {"path": _PATH, "dir_path": _DIR_PATH, "ref": _REF}
+)
@@ -6,8 +6,14 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import GIST_ID, REQ_GIST_ID
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 gist_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="list_gists",
     description="List gists for the authenticated user or a specific user",
     inputSchema={
@@ -25,18 +31,18 @@ gist_tools: list[Tool] = [
       },
     },
   ),
-  Tool(
+  _tool(
     name="get_gist",
     description="Get a specific gist by ID, including its files and content",
     inputSchema={
       "type": "object",
       "properties": {
-        "gist_id": {"type": "string", "description": "The gist ID"},
+        "gist_id": GIST_ID,
       },
-      "required": ["gist_id"],
+      "required": REQ_GIST_ID,
     },
   ),
-  Tool(
+  _tool(
     name="create_gist",
     description="Create a new gist with one or more files",
     inputSchema={
@@ -63,13 +69,13 @@ gist_tools: list[Tool] = [
       "required": ["files"],
     },
   ),
-  Tool(
+  _tool(
     name="edit_gist",
     description="Edit an existing gist's description or files",
     inputSchema={
       "type": "object",
       "properties": {
-        "gist_id": {"type": "string", "description": "The gist ID"},
+        "gist_id": GIST_ID,
         "description": {"type": "string", "description": "New gist description"},
         "files": {
           "type": "object",
@@ -82,10 +88,10 @@ gist_tools: list[Tool] = [
           },
         },
       },
-      "required": ["gist_id"],
+      "required": REQ_GIST_ID,
     },
   ),
-  Tool(
+  _tool(
     name="delete_gist",
     description="Permanently delete a gist",
     inputSchema={
@@ -93,10 +99,10 @@ gist_tools: list[Tool] = [
       "properties": {
         "gist_id": {"type": "string", "description": "The gist ID to delete"},
       },
-      "required": ["gist_id"],
+      "required": REQ_GIST_ID,
     },
   ),
-  Tool(
+  _tool(
     name="clone_gist",
     description="Clone a gist to a local directory",
     inputSchema={
@@ -104,7 +110,7 @@ gist_tools: list[Tool] = [
       "properties": {
         "gist_id": {"type": "string", "description": "The gist ID to clone"},
       },
-      "required": ["gist_id"],
+      "required": REQ_GIST_ID,
     },
   ),
 ]
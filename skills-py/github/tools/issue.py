@@ -6,15 +6,21 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import COMMENT_BODY, ISSUE_NUMBER, LABEL_FILTER, OWNER, REPO, REQ_OWNER_REPO, REQ_OWNER_REPO_NUMBER, STATE_ENUM
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 issue_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="list_issues",
     description="List issues in a repository with optional filters",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "limit": {
           "type": "number",
           "description": "Maximum number of issues to return",
@@ -23,36 +29,36 @@ issue_tools: list[Tool] = [
         "state": {
           "type": "string",
           "description": "Filter by state",
-          "enum": ["open", "closed", "all"],
+          "enum": STATE_ENUM,
           "default": "open",
         },
-        "label": {"type": "string", "description": "Filter by label name"},
+        "label": LABEL_FILTER,
         "assignee": {"type": "string", "description": "Filter by assignee username"},
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="get_issue",
     description="Get detailed information about a specific issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="create_issue",
     description="Create a new issue in a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "title": {"type": "string", "description": "Issue title"},
         "body": {"type": "string", "description": "Issue body (Markdown supported)"},
         "labels": {
@@ -69,93 +75,93 @@ issue_tools: list[Tool] = [
       "required": ["owner", "repo", "title"],
     },
   ),
-  Tool(
+  _tool(
     name="close_issue",
     description="Close an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "reason": {
           "type": "string",
           "description": "Reason for closing",
-          "enum": ["completed", "not_planned"],
+          "enum": ("completed", "not_planned"),
         },
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="reopen_issue",
     description="Reopen a closed issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="edit_issue",
     description="Edit an existing issue's title or body",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "title": {"type": "string", "description": "New issue title"},
         "body": {"type": "string", "description": "New issue body"},
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="comment_on_issue",
     description="Add a comment to an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
-        "body": {"type": "string", "description": "Comment body (Markdown supported)"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
+        "body": COMMENT_BODY,
       },
       "required": ["owner", "repo", "number", "body"],
     },
   ),
-  Tool(
+  _tool(
     name="list_issue_comments",
     description="List comments on an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "limit": {
           "type": "number",
           "description": "Maximum number of comments to return",
           "default": 30,
         },
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="add_issue_labels",
     description="Add labels to an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "labels": {
           "type": "array",
           "items": {"type": "string"},
@@ -165,15 +171,15 @@ issue_tools: list[Tool] = [
       "required": ["owner", "repo", "number", "labels"],
     },
   ),
-  Tool(
+  _tool(
     name="remove_issue_labels",
     description="Remove labels from an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "labels": {
           "type": "array",
           "items": {"type": "string"},
@@ -183,15 +189,15 @@ issue_tools: list[Tool] = [
       "required": ["owner", "repo", "number", "labels"],
     },
   ),
-  Tool(
+  _tool(
     name="add_issue_assignees",
     description="Add assignees to an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "assignees": {
           "type": "array",
           "items": {"type": "string"},
@@ -201,15 +207,15 @@ issue_tools: list[Tool] = [
       "required": ["owner", "repo", "number", "assignees"],
     },
   ),
-  Tool(
+  _tool(
     name="remove_issue_assignees",
     description="Remove assignees from an issue",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Issue number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": ISSUE_NUMBER,
         "assignees": {
           "type": "array",
           "items": {"type": "string"},
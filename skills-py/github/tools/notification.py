@@ -4,45 +4,38 @@ Notification tools (3 tools).
 
 from __future__ import annotations
 
-from mcp.types import Tool
+from ._spec import tools_from_spec
 
-notification_tools: list[Tool] = [
-  Tool(
-    name="list_notifications",
-    description="List GitHub notifications for the authenticated user",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "all": {
-          "type": "boolean",
-          "description": "Include read notifications",
-          "default": False,
-        },
-        "limit": {
-          "type": "number",
-          "description": "Maximum number of notifications to return",
-          "default": 50,
-        },
-      },
-    },
+_ALL = {
+  "type": "boolean",
+  "description": "Include read notifications",
+  "default": False,
+}
+_LIMIT = {
+  "type": "number",
+  "description": "Maximum number of notifications to return",
+  "default": 50,
+}
+_THREAD_ID = {"type": "string", "description": "Notification thread ID"}
+
+_SPEC = (
+  (
+    "list_notifications",
+    "List GitHub notifications for the authenticated user",
+    "all?,limit?",
   ),
-  Tool(
-    name="mark_notification_read",
-    description="Mark a specific notification thread as read",
-    inputSchema={
-      "type": "object",
-      "properties": {
-        "thread_id": {"type": "string", "description": "Notification thread ID"},
-      },
-      "required": ["thread_id"],
-    },
+  (
+    "mark_notification_read",
+    "Mark a specific notification thread as read",
+    "thread_id",
   ),
-  Tool(
-    name="mark_all_notifications_read",
-    description="Mark all notifications as read",
-    inputSchema={
-      "type": "object",
-      "properties": {},
-    },
+  (
+    "mark_all_notifications_read",
+    "Mark all notifications as read",
+    "",
   ),
-]
+)
+
+notification_tools = tools_from_spec(
+  _SPEC, {"all": _ALL, "limit": _LIMIT, "thread_id": _THREAD_ID}
+)
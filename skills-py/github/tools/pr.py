@@ -6,15 +6,21 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import COMMENT_BODY, LABEL_FILTER, OWNER, PR_NUMBER, REPO, REQ_OWNER_REPO, REQ_OWNER_REPO_NUMBER, STATE_ENUM
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 pr_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="list_prs",
     description="List pull requests in a repository with optional filters",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "limit": {
           "type": "number",
           "description": "Maximum number of pull requests to return",
@@ -23,36 +29,36 @@ pr_tools: list[Tool] = [
         "state": {
           "type": "string",
           "description": "Filter by state",
-          "enum": ["open", "closed", "all"],
+          "enum": STATE_ENUM,
           "default": "open",
         },
         "base": {"type": "string", "description": "Filter by base branch name"},
-        "label": {"type": "string", "description": "Filter by label name"},
+        "label": LABEL_FILTER,
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="get_pr",
     description="Get detailed information about a specific pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="create_pr",
     description="Create a new pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "title": {"type": "string", "description": "Pull request title"},
         "head": {
           "type": "string",
@@ -87,45 +93,45 @@ pr_tools: list[Tool] = [
       "required": ["owner", "repo", "title", "head"],
     },
   ),
-  Tool(
+  _tool(
     name="close_pr",
     description="Close a pull request without merging",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="reopen_pr",
     description="Reopen a closed pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="merge_pr",
     description="Merge a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
         "method": {
           "type": "string",
           "description": "Merge method to use",
-          "enum": ["merge", "squash", "rebase"],
+          "enum": ("merge", "squash", "rebase"),
           "default": "merge",
         },
         "delete_branch": {
@@ -135,137 +141,137 @@ pr_tools: list[Tool] = [
         },
         "commit_message": {"type": "string", "description": "Custom merge commit message"},
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="edit_pr",
     description="Edit a pull request's title, body, or base branch",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
         "title": {"type": "string", "description": "New pull request title"},
         "body": {"type": "string", "description": "New pull request body"},
         "base": {"type": "string", "description": "New base branch"},
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="comment_on_pr",
     description="Add a comment to a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
-        "body": {"type": "string", "description": "Comment body (Markdown supported)"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
+        "body": COMMENT_BODY,
       },
       "required": ["owner", "repo", "number", "body"],
     },
   ),
-  Tool(
+  _tool(
     name="list_pr_comments",
     description="List comments on a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
         "limit": {
           "type": "number",
           "description": "Maximum number of comments to return",
           "default": 30,
         },
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="list_pr_reviews",
     description="List reviews on a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="create_pr_review",
     description="Submit a review on a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
         "event": {
           "type": "string",
           "description": "Review action to perform",
-          "enum": ["APPROVE", "REQUEST_CHANGES", "COMMENT"],
+          "enum": ("APPROVE", "REQUEST_CHANGES", "COMMENT"),
         },
         "body": {"type": "string", "description": "Review comment body"},
       },
       "required": ["owner", "repo", "number", "event"],
     },
   ),
-  Tool(
+  _tool(
     name="list_pr_files",
     description="List files changed in a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="get_pr_diff",
     description="Get the unified diff for a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="get_pr_checks",
     description="Get CI/CD check runs and status for a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
-  Tool(
+  _tool(
     name="request_pr_reviewers",
     description="Request reviews from specific users on a pull request",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
         "reviewers": {
           "type": "array",
           "items": {"type": "string"},
@@ -275,17 +281,17 @@ pr_tools: list[Tool] = [
       "required": ["owner", "repo", "number", "reviewers"],
     },
   ),
-  Tool(
+  _tool(
     name="mark_pr_ready",
     description="Mark a draft pull request as ready for review",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
-        "number": {"type": "number", "description": "Pull request number"},
+        "owner": OWNER,
+        "repo": REPO,
+        "number": PR_NUMBER,
       },
-      "required": ["owner", "repo", "number"],
+      "required": REQ_OWNER_REPO_NUMBER,
     },
   ),
 ]
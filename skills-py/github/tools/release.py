@@ -6,45 +6,51 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import OWNER, REPO, REQ_OWNER_REPO, REQ_OWNER_REPO_TAG
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 release_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="list_releases",
     description="List releases for a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "limit": {
           "type": "number",
           "description": "Maximum number of releases to return",
           "default": 30,
         },
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="get_release",
     description="Get a specific release by tag name",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "tag": {"type": "string", "description": "Release tag name (e.g. 'v1.0.0')"},
       },
-      "required": ["owner", "repo", "tag"],
+      "required": REQ_OWNER_REPO_TAG,
     },
   ),
-  Tool(
+  _tool(
     name="create_release",
     description="Create a new release for a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "tag": {
           "type": "string",
           "description": "Tag name for the release (e.g. 'v1.0.0')",
@@ -74,17 +80,17 @@ release_tools: list[Tool] = [
           "default": False,
         },
       },
-      "required": ["owner", "repo", "tag"],
+      "required": REQ_OWNER_REPO_TAG,
     },
   ),
-  Tool(
+  _tool(
     name="delete_release",
     description="Delete a release by tag name",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "tag": {"type": "string", "description": "Release tag name to delete"},
         "cleanup_tag": {
           "type": "boolean",
@@ -92,32 +98,32 @@ release_tools: list[Tool] = [
           "default": False,
         },
       },
-      "required": ["owner", "repo", "tag"],
+      "required": REQ_OWNER_REPO_TAG,
     },
   ),
-  Tool(
+  _tool(
     name="list_release_assets",
     description="List assets (downloadable files) attached to a release",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "tag": {"type": "string", "description": "Release tag name"},
       },
-      "required": ["owner", "repo", "tag"],
+      "required": REQ_OWNER_REPO_TAG,
     },
   ),
-  Tool(
+  _tool(
     name="get_latest_release",
     description="Get the latest published release for a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
 ]
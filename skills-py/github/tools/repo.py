@@ -6,8 +6,14 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import OWNER, REPO, REQ_OWNER_REPO
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 repo_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="list_repos",
     description="List repositories for the authenticated user or a specific owner",
     inputSchema={
@@ -25,40 +31,40 @@ repo_tools: list[Tool] = [
         "visibility": {
           "type": "string",
           "description": "Filter by visibility",
-          "enum": ["all", "public", "private"],
+          "enum": ("all", "public", "private"),
         },
         "sort": {
           "type": "string",
           "description": "Sort field",
-          "enum": ["created", "updated", "pushed", "full_name"],
+          "enum": ("created", "updated", "pushed", "full_name"),
         },
       },
     },
   ),
-  Tool(
+  _tool(
     name="get_repo",
     description="Get detailed information about a specific repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="create_repo",
     description="Create a new repository for the authenticated user",
     inputSchema={
       "type": "object",
       "properties": {
-        "name": {"type": "string", "description": "Repository name"},
+        "name": REPO,
         "description": {"type": "string", "description": "Repository description"},
         "visibility": {
           "type": "string",
           "description": "Repository visibility",
-          "enum": ["public", "private"],
+          "enum": ("public", "private"),
           "default": "private",
         },
         "auto_init": {
@@ -70,7 +76,7 @@ repo_tools: list[Tool] = [
       "required": ["name"],
     },
   ),
-  Tool(
+  _tool(
     name="fork_repo",
     description="Fork a repository to the authenticated user's account",
     inputSchema={
@@ -83,63 +89,63 @@ repo_tools: list[Tool] = [
           "description": "Custom name for the forked repository",
         },
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="delete_repo",
     description="Permanently delete a repository. This action cannot be undone",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "confirm": {"type": "boolean", "description": "Must be true to confirm deletion"},
       },
       "required": ["owner", "repo", "confirm"],
     },
   ),
-  Tool(
+  _tool(
     name="clone_repo",
     description="Clone a repository to a local directory",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "directory": {
           "type": "string",
           "description": "Local directory path to clone into",
         },
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="list_collaborators",
     description="List collaborators on a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "limit": {
           "type": "number",
           "description": "Maximum number of collaborators to return",
           "default": 30,
         },
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="add_collaborator",
     description="Add a collaborator to a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "username": {
           "type": "string",
           "description": "GitHub username of the collaborator to add",
@@ -147,21 +153,21 @@ repo_tools: list[Tool] = [
         "permission": {
           "type": "string",
           "description": "Permission level to grant",
-          "enum": ["pull", "triage", "push", "maintain", "admin"],
+          "enum": ("pull", "triage", "push", "maintain", "admin"),
           "default": "push",
         },
       },
       "required": ["owner", "repo", "username"],
     },
   ),
-  Tool(
+  _tool(
     name="remove_collaborator",
     description="Remove a collaborator from a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "username": {
           "type": "string",
           "description": "GitHub username of the collaborator to remove",
@@ -170,26 +176,26 @@ repo_tools: list[Tool] = [
       "required": ["owner", "repo", "username"],
     },
   ),
-  Tool(
+  _tool(
     name="list_topics",
     description="List topics (tags) on a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
-  Tool(
+  _tool(
     name="set_topics",
     description="Replace all topics on a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
         "topics": {
           "type": "array",
           "items": {"type": "string"},
@@ -199,16 +205,16 @@ repo_tools: list[Tool] = [
       "required": ["owner", "repo", "topics"],
     },
   ),
-  Tool(
+  _tool(
     name="list_languages",
     description="List programming languages detected in a repository",
     inputSchema={
       "type": "object",
       "properties": {
-        "owner": {"type": "string", "description": "Repository owner"},
-        "repo": {"type": "string", "description": "Repository name"},
+        "owner": OWNER,
+        "repo": REPO,
       },
-      "required": ["owner", "repo"],
+      "required": REQ_OWNER_REPO,
     },
   ),
 ]
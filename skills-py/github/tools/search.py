@@ -6,8 +6,14 @@ from __future__ import annotations
 
 from mcp.types import Tool
 
+from ._fragments import LIMIT_30, REQ_QUERY
+
+# Definitions below are literal and well-formed; model_construct skips
+# pydantic's per-field validation at import time.
+_tool = Tool.model_construct
+
 search_tools: list[Tool] = [
-  Tool(
+  _tool(
     name="search_repos",
     description="Search GitHub repositories by query",
     inputSchema={
@@ -17,27 +23,23 @@ search_tools: list[Tool] = [
           "type": "string",
           "description": "Search query (supports GitHub search syntax)",
         },
-        "limit": {
-          "type": "number",
-          "description": "Maximum number of results to return",
-          "default": 30,
-        },
+        "limit": LIMIT_30,
         "sort": {
           "type": "string",
           "description": "Sort field",
-          "enum": ["stars", "forks", "help-wanted-issues", "updated"],
+          "enum": ("stars", "forks", "help-wanted-issues", "updated"),
         },
         "order": {
           "type": "string",
           "description": "Sort order",
-          "enum": ["asc", "desc"],
+          "enum": ("asc", "desc"),
           "default": "desc",
         },
       },
-      "required": ["query"],
+      "required": REQ_QUERY,
     },
   ),
-  Tool(
+  _tool(
     name="search_issues",
     description="Search issues and pull requests across GitHub",
     inputSchema={
@@ -47,21 +49,17 @@ search_tools: list[Tool] = [
           "type": "string",
           "description": "Search query (supports GitHub search syntax, e.g. 'is:issue is:open label:bug')",
         },
-        "limit": {
-          "type": "number",
-          "description": "Maximum number of results to return",
-          "default": 30,
-        },
+        "limit": LIMIT_30,
         "sort": {
           "type": "string",
           "description": "Sort field",
-          "enum": ["comments", "reactions", "created", "updated"],
+          "enum": ("comments", "reactions", "created", "updated"),
         },
       },
-      "required": ["query"],
+      "required": REQ_QUERY,
     },
   ),
-  Tool(
+  _tool(
     name="search_code",
     description="Search code across GitHub repositories",
     inputSchema={
@@ -71,21 +69,17 @@ search_tools: list[Tool] = [
           "type": "string",
           "description": "Search query (supports GitHub code search syntax)",
         },
-        "limit": {
-          "type": "number",
-          "description": "Maximum number of results to return",
-          "default": 30,
-        },
+        "limit": LIMIT_30,
         "repo": {
           "type": "string",
           "description": "Restrict search to a specific repo (owner/name format)",
         },
         "language": {"type": "string", "description": "Filter by programming language"},
       },
-      "required": ["query"],
+      "required": REQ_QUERY,
     },
   ),
-  Tool(
+  _tool(
     name="search_commits",
     description="Search commits across GitHub repositories",
     inputSchema={
@@ -95,17 +89,13 @@ search_tools: list[Tool] = [
           "type": "string",
           "description": "Search query (supports GitHub commit search syntax)",
         },
-        "limit": {
-          "type": "number",
-          "description": "Maximum number of results to return",
-          "default": 30,
-        },
+        "limit": LIMIT_30,
         "repo": {
           "type": "string",
           "description": "Restrict search to a specific repo (owner/name format)",
         },
       },
-      "required": ["query"],
+      "required": REQ_QUERY,
     },
   ),
 ]
@@ -16,7 +16,7 @@ log = logging.getLogger("skill.onepassword.helpers")
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
   content: str
   is_error: bool = False
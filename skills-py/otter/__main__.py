@@ -18,21 +18,13 @@ logging.basicConfig(
 
 
 def main() -> None:
-  if "--mcp" in sys.argv:
-    # MCP mode not implemented for Otter — fall through to SkillServer
-    from dev.runtime.server import SkillServer
+  # MCP mode not implemented for Otter — --mcp falls through to SkillServer
+  from dev.runtime.server import SkillServer
 
-    from .skill import skill
+  from .skill import skill
 
-    server = SkillServer(skill)
-    server.start()
-  else:
-    from dev.runtime.server import SkillServer
-
-    from .skill import skill
-
-    server = SkillServer(skill)
-    server.start()
+  server = SkillServer(skill)
+  server.start()
 
 
 if __name__ == "__main__":
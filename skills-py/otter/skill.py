@@ -25,9 +25,7 @@ from dev.types.skill_types import (
   SkillTool,
   ToolDefinition,
 )
-from dev.types.skill_types import (
-  ToolResult as SkillToolResult,
-)
+from dev.types.skill_types import ToolResult as SkillToolResult
 
 from .handlers import dispatch_tool
 from .setup import on_setup_cancel, on_setup_start, on_setup_submit
@@ -5,27 +5,24 @@ from typing import Any
 
 """Section: Filter to likely tool names (exclude the skill name itself and common fields)"""
 
+# One compiled alternation finds every hook assignment in a single pass
+# over the source instead of one re.search scan per hook name.
+_HOOK_RE = re.compile(
+  r"\b(on_load|on_unload|on_session_start|on_session_end"
+  r"|on_before_message|on_after_response|on_tick)\s*=\s*\w"
+)
+
+# Hook names that are never tool names.
+_RESERVED_HOOK_NAMES = frozenset({"on_load", "on_unload", "on_tick"})
+
 
 # Filter to likely tool names (exclude the skill name itself and common fields)
 def _filter_tool_names(tool_names: list[str], info: dict[str, Any], content: str) -> dict[str, Any]:
   """Filter tool names and find hooks."""
-  info["tool_names"] = [
-    n for n in tool_names if n != info.get("name") and n not in ("on_load", "on_unload", "on_tick")
-  ]
+  excluded = _RESERVED_HOOK_NAMES | {info.get("name")}
+  info["tool_names"] = [n for n in tool_names if n not in excluded]
 
   # Find defined hooks
-  hooks_found = []
-  for hook in (
-    "on_load",
-    "on_unload",
-    "on_session_start",
-    "on_session_end",
-    "on_before_message",
-    "on_after_response",
-    "on_tick",
-  ):
-    if re.search(rf"{hook}\s*=\s*\w", content):
-      hooks_found.append(hook)
-  info["hooks"] = hooks_found
+  info["hooks"] = sorted({m.group(1) for m in _HOOK_RE.finditer(content)})
 
   return info